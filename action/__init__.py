@@ -1 +1,9 @@
-from . import calculate_coordinates, generate_blender_file
+import utils
+from . import build_map, calculate_coordinates, jobs, serve
+
+try:
+    from . import generate_blender_file
+except ModuleNotFoundError as err:  # Outside Blender: only the actions without bpy are available
+    if err.name not in utils.common.blender_modules:
+        raise
+    generate_blender_file = None
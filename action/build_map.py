@@ -0,0 +1,143 @@
+"""
+Module for build of map with a pool of Blender workers (no bpy required)
+"""
+
+import logging
+import os
+import queue
+import subprocess
+import threading
+from typing import Dict, List, Optional
+
+import config
+import utils
+from . import jobs as jobs_utils
+
+# VARIABLES ===================================================================
+name = 'build_map'
+__logger = logging.getLogger(name)
+__extensions = ['.csv', '.tsv']
+
+# Command of a worker: Blender in background with the addon in worker mode of generate_blender_file action
+__worker_script = os.path.join('samples', 'blender-cartography-addon-exec.py')
+__worker_action = 'generate_blender_file'
+
+
+# METHODS =====================================================================
+def entry_point(args: any):
+    if args.validation and args.validation not in config.geom_validation_levels:  # Before start of workers
+        raise Exception('Unknown validation level: <{}>. Expected: <{}>'.format(
+            args.validation, '|'.join(config.geom_validation_levels)
+        ))
+    if not args.batch:
+        raise Exception('A directory or glob pattern of files (batch) required for action <{}>'.format(name))
+    filepaths = utils.io.path.find(args.batch, __extensions)
+    if not filepaths:
+        raise Exception('No file found for <{}> in batch mode of action <{}>'.format(args.batch, name))
+    execute(filepaths, args.output, args.jobs, args.blender, args.validation)
+
+
+def execute(filepaths: List[os.path], target_dir: Optional[os.path] = None, workers: Optional[int] = None,
+            blender: Optional[str] = None, validation: Optional[str] = None) -> Dict[os.path, dict]:
+    """
+    Draw the room of each CSV file in a pool of Blender processes (one .blend by room).
+
+    :param filepaths Files to draw
+    :param target_dir Directory where write the Blender files (optional, nothing is saved by default)
+    :param workers Number of Blender processes (optional, number of processors by default)
+    :param blender Blender executable (optional, "blender" by default)
+    :param validation Level of validation of drawn geometry (optional, level of config by default)
+    :return Result by file: output, error (None if success) and duration (in seconds)
+    """
+    workers = max(min(workers or os.cpu_count() or 1, len(filepaths)), 1)
+    __logger.info('Build of map start for <%d> files with <%d> workers...', len(filepaths), workers)
+    targets = utils.io.path.relative_targets(filepaths, target_dir, '.blend') if target_dir else {}
+    for target in targets.values():
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+    # Queue all jobs, the workers take a new job when the previous is done
+    jobs = queue.Queue()
+    for filepath in filepaths:
+        target = targets.get(filepath)
+        jobs.put({'file': os.path.realpath(filepath), 'output': os.path.realpath(target) if target else None})
+
+    results: Dict[os.path, dict] = {}
+    threads = [
+        threading.Thread(
+            target=__run_worker,
+            args=(i + 1, blender or 'blender', validation, jobs, results),
+            daemon=True
+        )
+        for i in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Jobs not executed if all workers stopped
+    while not jobs.empty():
+        job = jobs.get_nowait()
+        results[job['file']] = dict(job, error='Not executed: no worker available', duration=0)
+
+    results = {f: results[os.path.realpath(f)] for f in filepaths}
+    jobs_utils.log_summary(__logger, 'Build of map', {f: r['error'] for f, r in results.items()})
+    return results
+
+
+def __run_worker(index: int, blender: str, validation: Optional[str], jobs: queue.Queue, results: Dict[os.path, dict]):
+    command = [blender, '--background', '--python', __worker_script, '--', '-a', __worker_action, '--worker']
+    if validation:
+        command += ['-c', validation]
+    __logger.debug('[worker %d] Start: %s', index, ' '.join(command))
+    try:
+        process = subprocess.Popen(
+            command,
+            cwd=utils.io.path.workspace(),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+            encoding='utf8',
+            bufsize=1
+        )
+    except OSError as err:
+        __logger.error('[worker %d] Failed to start Blender <%s>', index, blender, exc_info=err)
+        return
+
+    job = None
+    try:
+        while True:
+            try:
+                job = jobs.get_nowait()
+            except queue.Empty:
+                break
+
+            __logger.info('[worker %d] Draw <%s>...', index, job['file'])
+            process.stdin.write(jobs_utils.format_job(job))
+            process.stdin.flush()
+            result = __read_result(index, process)
+            if result is None:
+                results[job['file']] = dict(job, error='Worker stopped (code: {})'.format(process.poll()), duration=0)
+                break
+            results[job['file']] = result
+            __logger.info('[worker %d] <%s> done in <%.3f>s', index, job['file'], result['duration'])
+    except OSError as err:  # Broken pipe: worker stopped
+        __logger.error('[worker %d] Communication failed', index, exc_info=err)
+        if job and job['file'] not in results:
+            results[job['file']] = dict(job, error=jobs_utils.format_error(err), duration=0)
+    finally:
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        process.wait()
+        __logger.debug('[worker %d] Stopped (code: %s)', index, process.returncode)
+
+
+def __read_result(index: int, process: subprocess.Popen) -> Optional[dict]:
+    for line in process.stdout:
+        result = jobs_utils.parse_result(line)
+        if result is not None:
+            return result
+        __logger.debug('[worker %d] %s', index, line.rstrip())
+    return None  # End of output: worker stopped
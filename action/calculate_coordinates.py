@@ -1,21 +1,32 @@
 import logging
 import os
 import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-
-from mathutils import Vector
+from typing import Dict, List, Optional
 
 import utils
 from reading import CartographyCsvReader, CartographyFile, CartographyFileSide, CartographyTsvReader
+from utils.math import Vector
 from writing import CartographyCsvWriter, CartographyTsvWriter
+from . import jobs as jobs_utils
 
 # VARIABLES ===================================================================
 name = 'calculate_coordinates'
 __logger = logging.getLogger(name)
+__extensions = ['.csv', '.tsv']
 
 
 # METHODS =====================================================================
 def entry_point(args: any):
+    if args.batch:
+        filepaths = utils.io.path.find(args.batch, __extensions)
+        if not filepaths:
+            raise Exception('No file found for <{}> in batch mode of action <{}>'.format(args.batch, name))
+        execute_batch(filepaths, args.output, args.jobs)
+        return
+
     file = args.file
     if not file:
         raise Exception('A file required for action <{}>'.format(name))
@@ -37,6 +48,56 @@ def execute(filepath: os.path, target_path: os.path):
     __logger.info('Calculation of coordinates finished with success!')
 
 
+def execute_batch(filepaths: List[os.path], target_dir: Optional[os.path] = None, jobs: Optional[int] = None) \
+        -> Dict[os.path, Optional[str]]:
+    """
+    Calculate coordinates of many CSV files in parallel (one process by job).
+
+    :param filepaths Files to update
+    :param target_dir Directory where write the files (optional, files are updated with a backup by default)
+    :param jobs Number of processes (optional, number of processors by default)
+    :return Error by file (None if the file was updated with success)
+    """
+    __logger.info('Calculation of coordinates start for <%d> files...', len(filepaths))
+    # Same tree of directories as files in target directory: never the same target for two files
+    targets = utils.io.path.relative_targets(filepaths, target_dir) if target_dir else {}
+    for target in targets.values():
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+    errors: Dict[os.path, Optional[str]] = {}
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(execute_job, {'file': f, 'output': targets.get(f)}): f for f in filepaths}
+        for future in as_completed(futures):
+            errors[futures[future]] = future.result()['error']
+
+    errors = {f: errors[f] for f in filepaths}
+    jobs_utils.log_summary(__logger, 'Calculation of coordinates', errors)
+    return errors
+
+
+def execute_job(job: dict) -> dict:
+    """
+    Calculate coordinates of the file of a job.
+
+    :param job Job with the file to update (file) and the file to write (output, optional, file updated by default)
+    :return Result of job: file, output, error (None if success) and duration (in seconds)
+    """
+    start = time.perf_counter()
+    error = None
+    try:
+        execute(job.get('file'), job.get('output') or job.get('file'))
+    except Exception as err:
+        __logger.error('Failed to calculate coordinates of <%s>', job.get('file'), exc_info=err)
+        error = jobs_utils.format_error(err)
+
+    return {
+        'file': job.get('file'),
+        'output': job.get('output'),
+        'error': error,
+        'duration': round(time.perf_counter() - start, 3)
+    }
+
+
 def __read_csv_file(filepath: os.path) -> CartographyFile:
     __logger.info('Read CSV file <%s>', filepath)
 
@@ -53,12 +114,25 @@ def __read_csv_file(filepath: os.path) -> CartographyFile:
 
 
 def __calculate_coordinates(file: CartographyFile):
-    for point in file.points:
-        point.location = utils.math.calc_coordinates_by_dist(
-            Vector((point.s1_distance, point.s2_distance, point.height)),
-            file.info.s1s2_distance,
-            point.side == CartographyFileSide.LEFT
-        )
+    points = file.points
+    if utils.math.numpy is None:  # Without NumPy: point by point
+        for point in points:
+            point.location = utils.math.calc_coordinates_by_dist(
+                Vector((point.s1_distance, point.s2_distance, point.height)),
+                file.info.s1s2_distance,
+                point.side == CartographyFileSide.LEFT
+            )
+        return
+
+    locations = utils.math.calc_coordinates_by_dist_batch(
+        [p.s1_distance for p in points],
+        [p.s2_distance for p in points],
+        [p.height for p in points],
+        file.info.s1s2_distance,
+        [p.side == CartographyFileSide.LEFT for p in points]
+    )
+    for point, location in zip(points, locations.tolist()):
+        point.location = Vector(location)
 
 
 def __backup_csv_file(file: CartographyFile):
@@ -83,7 +157,14 @@ def __write_csv_file(file: CartographyFile, target_path: os.path):
     else:  # if extension is '.csv':
         separator = '\t'  # TODO open popup for ask to user choose the file separator
         writer = CartographyCsvWriter(separator)
-    writer.write(file, target_path)
+    # Write in a temporary file then replace the target, for never keep a partially written file
+    temp_path = str(target_path) + '.tmp'
+    try:
+        writer.write(file, temp_path)
+        os.replace(temp_path, target_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
 
     __logger.info('CSV file <%s> write with success!', target_path)
     return file
@@ -1,21 +1,45 @@
 import logging
 import os
+import sys
+import time
+from typing import Dict, List, Optional, TextIO
 
+import bpy
+
+import config
 import utils
 from drawing import CartographyDrawer, CartographyInterestPointDrawer, CartographyStructuralPointDrawer, \
     CartographyPlaneDrawer, CartographyMeshDrawer
-from parsing import CartographyParser
+from drawing.drawer.mesh import validation
+from model import CartographyRoom
+from parsing import CartographyParser, pool as parsing_pool
 from reading import CartographyCsvReader, CartographyTsvReader
-from templating import CartographyTemplateReader
+from templating import CartographyTemplate, CartographyTemplateReader
+from . import jobs as jobs_utils
 
 # VARIABLES ===================================================================
 name = 'generate_blender_file'
 __logger = logging.getLogger(name)
+__extensions = ['.csv', '.tsv']
 
 
 # METHODS =====================================================================
 def entry_point(args: any):
+    if args.validation:
+        validation.check_level(args.validation)  # Before read of files
+        config.geom_validation = args.validation
     utils.blender.scene.clear()
+    if args.worker:
+        __logger.info('Worker mode: wait jobs on standard input...')
+        execute_jobs(sys.stdin, sys.stdout)
+        return
+    if args.batch:
+        filepaths = utils.io.path.find(args.batch, __extensions)
+        if not filepaths:
+            raise Exception('No file found for <{}> in batch mode of action <{}>'.format(args.batch, name))
+        execute_batch(filepaths, args.output, args.jobs)
+        return
+
     file = args.file
     if not file:
         raise Exception('A file required for action <{}>'.format(name))
@@ -24,14 +48,122 @@ def entry_point(args: any):
         utils.blender.io.export_blend_file(args.output)
 
 
-def execute(filepath: os.path):
-    """Read, parse a CSV file and create the room from coordinates"""
+def execute(filepath: os.path, template: Optional[CartographyTemplate] = None,
+            room: Optional[CartographyRoom] = None) -> bpy.types.Collection:
+    """Read, parse a CSV file (if the room isn't already parsed) and create the room from coordinates"""
     __logger.info('Generation of blender file start...')
-    file = __read_csv_file(filepath)
-    room = __parse_cartography_file(file)
-    template = __read_blender_template()
-    __draw_blender_model(room, template)
+    if room is None:
+        file = __read_csv_file(filepath)
+        room = __parse_cartography_file(file)
+    template = template or read_template()
+    collection = __draw_blender_model(room, template)
     __logger.info('Generation of blender file finished with success!')
+    return collection
+
+
+def execute_batch(filepaths: List[os.path], output: Optional[os.path] = None, workers: Optional[int] = None) \
+        -> Dict[os.path, Optional[str]]:
+    """
+    Create the rooms of many CSV files in the same Blender session (the template is read only once).<br />
+    NB: the files are read and parsed in a pool of processes, a room is drawn while the next rooms are parsed.
+
+    :param filepaths Files to draw
+    :param output Blender file for a combined map of all rooms (*.blend) or directory for a Blender file by room
+    (optional, nothing is saved by default)
+    :param workers Number of processes for parsing (optional, number of processors by default)
+    :return Error by file (None if the room was drawn with success)
+    """
+    __logger.info('Generation of blender files start for <%d> files...', len(filepaths))
+    combined = output and output.lower().endswith('.blend')
+    targets = utils.io.path.relative_targets(filepaths, output, '.blend') if output and not combined else {}
+    for target in targets.values():
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+
+    template = read_template()
+    errors: Dict[os.path, Optional[str]] = {}
+    for filepath, room, error in parsing_pool.parse_files(filepaths, workers):
+        if error:
+            __logger.error('Failed to parse <%s>: %s', filepath, error)
+            errors[filepath] = error
+        elif combined:
+            # Keep the room in scene if drawn with success
+            collections = set(bpy.data.collections)
+            try:
+                execute(filepath, template, room)
+                errors[filepath] = None
+            except Exception as err:
+                __logger.error('Failed to generate blender file of <%s>', filepath, exc_info=err)
+                errors[filepath] = jobs_utils.format_error(err)
+                __remove_new_collections(collections)
+        else:
+            errors[filepath] = execute_job({'file': filepath, 'output': targets.get(filepath)}, template, room)['error']
+
+    if combined:
+        utils.blender.io.export_blend_file(output)
+
+    jobs_utils.log_summary(__logger, 'Generation of blender files', errors)
+    return errors
+
+
+def execute_job(job: dict, template: CartographyTemplate, room: Optional[CartographyRoom] = None) -> dict:
+    """
+    Draw the room of a job and save it, then reset the scene for the next job.
+
+    :param job Job with the file to draw (file) and the Blender file to write (output, optional)
+    :param template Template already read
+    :param room Room of file already parsed (optional, the file is read and parsed by default)
+    :return Result of job: file, output, error (None if success) and duration (in seconds)
+    """
+    start = time.perf_counter()
+    collections = set(bpy.data.collections)
+    error = None
+    try:
+        execute(job.get('file'), template, room)
+        if job.get('output'):
+            utils.blender.io.export_blend_file(job.get('output'))
+    except Exception as err:
+        __logger.error('Failed to generate blender file of <%s>', job.get('file'), exc_info=err)
+        error = jobs_utils.format_error(err)
+    finally:
+        __remove_new_collections(collections)
+
+    return {
+        'file': job.get('file'),
+        'output': job.get('output'),
+        'error': error,
+        'duration': round(time.perf_counter() - start, 3)
+    }
+
+
+def execute_jobs(jobs: TextIO, results: TextIO, template: Optional[CartographyTemplate] = None):
+    """Execute the jobs read from a stream (a JSON object by line) and write the result of each job"""
+    template = template or read_template()
+    for line in jobs:
+        job = jobs_utils.parse_job(line)
+        if job:
+            results.write(jobs_utils.format_result(execute_job(job, template)))
+            results.flush()
+
+
+def read_template() -> CartographyTemplate:
+    """Read the .blend template of workspace (to give to the execution of many rooms)"""
+    blend_path = os.path.join(utils.io.path.workspace(), 'bca-template.blend')
+    __logger.info('Read .blend template <%s>', blend_path)
+    reader = CartographyTemplateReader()
+    template = reader.read(blend_path)
+    __logger.info('Template .blend <%s> read with success!', blend_path)
+    return template
+
+
+def unload_template(template: CartographyTemplate):
+    """Remove the objects of a template read before (to read it again without keep the previous objects)"""
+    CartographyTemplateReader().unload(template)
+
+
+def __remove_new_collections(previous_collections: set):
+    scene_collections = bpy.context.scene.collection.children
+    for collection in [c for c in scene_collections if c not in previous_collections]:
+        utils.blender.collection.remove(collection, True)
 
 
 def __read_csv_file(filepath):
@@ -55,15 +187,6 @@ def __parse_cartography_file(file):
     return room
 
 
-def __read_blender_template():
-    blend_path = os.path.join(utils.io.path.workspace(), 'bca-template.blend')
-    __logger.info('Read .blend template <%s>', blend_path)
-    reader = CartographyTemplateReader()
-    template = reader.read(blend_path)
-    __logger.info('Template .blend <%s> read with success!', blend_path)
-    return template
-
-
 def __draw_blender_model(room, template):
     __logger.info('Draw room <%s>', room.name)
     drawer = CartographyDrawer(
@@ -73,5 +196,6 @@ def __draw_blender_model(room, template):
         # CartographyPlaneDrawer(template)
         CartographyMeshDrawer(template)
     )
-    drawer.draw(room)
+    collection = drawer.draw(room)
     __logger.info('<%s> room drawn with success!', room.name)
+    return collection
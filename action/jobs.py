@@ -0,0 +1,50 @@
+"""
+Module for jobs of actions (batch summary and line protocol between an orchestrator and its workers)
+"""
+
+import json
+import logging
+import os
+from typing import Dict, Optional
+
+# VARIABLES ===================================================================
+# Prefix of result lines written by a worker (the other lines of its output are logs)
+result_prefix = 'BCA-RESULT '
+
+
+# METHODS =====================================================================
+# Protocol --------------------------------------------------------------------
+def format_job(job: dict) -> str:
+    """Format a job (or any message) in a line of JSON"""
+    return json.dumps(job) + '\n'
+
+
+def parse_job(line: str) -> Optional[dict]:
+    """Get the job (or any message) of a line of JSON (None if the line is empty)"""
+    line = line.strip()
+    return json.loads(line) if line else None
+
+
+def format_result(result: dict) -> str:
+    return result_prefix + json.dumps(result) + '\n'
+
+
+def parse_result(line: str) -> Optional[dict]:
+    """Get the result of a line written by a worker (None if the line isn't a result)"""
+    return json.loads(line[len(result_prefix):]) if line.startswith(result_prefix) else None
+
+
+def format_error(err: Exception) -> str:
+    return '{}: {}'.format(type(err).__name__, err)
+
+
+# Summary ---------------------------------------------------------------------
+def log_summary(logger: logging.Logger, title: str, errors: Dict[os.path, Optional[str]]):
+    """Log the result of each file (error by file, None if success) and the count of success/failures"""
+    failed = [f for f, e in errors.items() if e]
+    for filepath, error in errors.items():
+        if error:
+            logger.error('[FAILED] %s: %s', filepath, error)
+        else:
+            logger.info('[OK] %s', filepath)
+    logger.info('%s finished: <%d> success, <%d> failure(s)', title, len(errors) - len(failed), len(failed))
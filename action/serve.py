@@ -0,0 +1,159 @@
+"""
+Module for resident server of jobs (the addon and the template stay loaded between jobs)
+"""
+
+import hmac
+import logging
+import os
+import secrets
+import socketserver
+import time
+from typing import Optional
+
+import utils
+from . import calculate_coordinates, jobs as jobs_utils
+
+try:
+    from . import generate_blender_file
+except ModuleNotFoundError as err:  # Outside Blender: only the calculation of coordinates is available
+    if err.name not in utils.common.blender_modules:
+        raise
+    generate_blender_file = None
+
+# VARIABLES ===================================================================
+name = 'serve'
+__logger = logging.getLogger(name)
+__host = '127.0.0.1'  # Local connections only
+__default_port = 5566
+__token_variable = 'BCA_SERVE_TOKEN'  # Token of server (optional, a new token is generated by default)
+__token_filename = 'bca-serve.token'  # File of token in workspace, readable by the owner only
+
+
+# CLASSES =====================================================================
+class CartographyJobServer(socketserver.TCPServer):
+    """
+    Server of jobs: a JSON object by line, the result of each job is sent back as a JSON line.<br />
+    Each job must have the token of server (token field), any local user can connect to the port.<br />
+    Jobs:
+    <ul>
+        <li>{"action": "generate_blender_file", "file": "room.tsv", "output": "room.blend"}: draw a room (the output
+        is optional), the scene is reset after the job</li>
+        <li>{"action": "calculate_coordinates", "file": "room.tsv", "output": "room2.tsv"}: update coordinates (the
+        output is optional, the file is updated by default)</li>
+        <li>{"action": "reload_template"}: read the .blend template again</li>
+        <li>{"action": "stop"}: stop the server</li>
+    </ul>
+    NB: jobs are executed one by one in the main thread (bpy isn't thread safe).
+    """
+    allow_reuse_address = True
+
+    # Constructor -------------------------------------------------------------
+    def __init__(self, port: int, host: str, token: str):
+        super().__init__((host, port), CartographyJobRequestHandler)
+        self.logger = logging.getLogger(name)
+        self.token = token
+        self.template = None  # CartographyTemplate, read once (Blender only)
+        self.stopped = False
+
+    # Methods -----------------------------------------------------------------
+    def execute_job(self, job: dict) -> dict:
+        if not isinstance(job, dict):
+            self.logger.warning('Invalid job: %s', job)
+            return {'action': None, 'error': 'Invalid job <{}>: JSON object required'.format(job), 'duration': 0}
+        token = job.pop('token', None)
+        if not isinstance(token, str) or not hmac.compare_digest(token, self.token):
+            self.logger.warning('Job refused: invalid token')
+            return {'action': None, 'error': 'Invalid token', 'duration': 0}
+
+        action = job.get('action', 'generate_blender_file')
+        self.logger.info('Execute job <%s>: %s', action, job)
+
+        file_action = action in (calculate_coordinates.name, 'generate_blender_file')
+        if file_action and not isinstance(job.get('file'), str):
+            result = dict(job, error='A file required for action <{}>'.format(action), duration=0)
+        elif file_action and not isinstance(job.get('output') or '', str):
+            result = dict(job, error='Invalid output <{}> for action <{}>'.format(job['output'], action), duration=0)
+        elif action == calculate_coordinates.name:
+            result = calculate_coordinates.execute_job(job)
+        elif generate_blender_file and action == generate_blender_file.name:
+            if self.template is None:
+                self.template = generate_blender_file.read_template()
+            result = generate_blender_file.execute_job(job, self.template)
+        elif generate_blender_file and action == 'reload_template':
+            start = time.perf_counter()
+            if self.template is not None:  # Else the previous objects stay and the new ones are renamed
+                generate_blender_file.unload_template(self.template)
+                self.template = None
+            self.template = generate_blender_file.read_template()
+            result = {'error': None, 'duration': round(time.perf_counter() - start, 3)}
+        elif action == 'stop':
+            self.stopped = True
+            result = {'error': None, 'duration': 0}
+        else:
+            result = dict(job, error='Unknown or unavailable action <{}>'.format(action), duration=0)
+
+        result['action'] = action
+        self.logger.info('Job <%s> done in <%.3f>s (error: %s)', action, result['duration'], result['error'])
+        return result
+
+    def serve_until_stopped(self):
+        while not self.stopped:
+            self.handle_request()
+
+
+class CartographyJobRequestHandler(socketserver.StreamRequestHandler):
+    """Connection of a client, it can send many jobs before closing"""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                job = jobs_utils.parse_job(line.decode('utf8'))
+            except ValueError as err:  # Invalid JSON
+                result = {'action': None, 'error': jobs_utils.format_error(err), 'duration': 0}
+            else:
+                if job is None:
+                    continue
+                result = self.server.execute_job(job)
+
+            self.wfile.write(jobs_utils.format_job(result).encode('utf8'))
+            self.wfile.flush()
+            if self.server.stopped:
+                break
+
+
+# METHODS =====================================================================
+def entry_point(args: any):
+    execute(args.port)
+
+
+def execute(port: Optional[int] = None, token: Optional[str] = None):
+    """
+    Start the server of jobs on local host and wait jobs until a stop job is received.<br />
+    NB: the token is written in a file of workspace readable by the owner only (bca-serve.token), the clients must
+    read it and give it in each job.
+
+    :param port Port of server (optional, 5566 by default)
+    :param token Token required in jobs (optional, BCA_SERVE_TOKEN variable or a new token by default)
+    """
+    port = port or __default_port
+    token = token or os.environ.get(__token_variable) or secrets.token_urlsafe(32)
+    token_path = os.path.join(utils.io.path.workspace(), __token_filename)
+    with CartographyJobServer(port, __host, token) as server:
+        __write_token(token_path, token)
+        try:
+            if generate_blender_file:
+                server.template = generate_blender_file.read_template()
+            __logger.info('Server of jobs listen on <%s:%d> (token in <%s>)...', __host, port, token_path)
+            server.serve_until_stopped()
+        finally:
+            os.remove(token_path)
+    __logger.info('Server of jobs stopped')
+
+
+# METHODS - INTERNAL ==========================================================
+def __write_token(filepath: os.path, token: str):
+    if os.path.exists(filepath):
+        os.remove(filepath)  # Else the permissions of previous file are kept
+    fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, 'w') as file:
+        file.write(token)
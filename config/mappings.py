@@ -2,4 +2,29 @@ import os
 
 import utils
 
-words = utils.io.file.read_json(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'mappings_words.json'))
+# VARIABLES ===================================================================
+__path = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'mappings_words.json')
+
+words = {}
+version = None  # Version of words: modification time and size of JSON file
+
+
+# METHODS =====================================================================
+def reload_if_changed() -> bool:
+    """
+    Read the words again if the JSON file was changed since the last read.
+
+    :return If words were read
+    """
+    global words, version
+
+    stat = os.stat(__path)
+    file_version = (stat.st_mtime_ns, stat.st_size)
+    if file_version == version:
+        return False
+    words = utils.io.file.read_json(__path)
+    version = file_version
+    return True
+
+
+reload_if_changed()
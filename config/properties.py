@@ -1,2 +1,5 @@
 obs_separator = ','  # Separator for observations
 max_climbing_height = 1  # Max size for a climbing wall
+obs_cache_size = 4096  # Max count of observations in cache of analysis
+geom_validation_levels = ['off', 'fast', 'full']  # off: nothing, fast: duplicates, full: and faces/edges
+geom_validation = 'off'  # Validation of each drawn group (fast/full for debug: drawers already reject duplicates)
@@ -9,6 +9,8 @@ History:
 
 import logging
 
+import bpy
+
 import utils
 from model import CartographyRoom
 from templating import CartographyTemplate
@@ -27,7 +29,8 @@ class CartographyDrawer:
         self.__room_drawers = room_drawers
 
     # Methods -----------------------------------------------------------------
-    def draw(self, room: CartographyRoom):
+    def draw(self, room: CartographyRoom) -> bpy.types.Collection:
         collection = utils.blender.collection.create(room.name)
         for roomDrawer in self.__room_drawers:
             roomDrawer.draw(room, collection)
+        return collection
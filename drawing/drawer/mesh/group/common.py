@@ -4,14 +4,14 @@ Module for common of mesh group drawer
 
 import logging
 from abc import abstractmethod
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from bmesh.types import BMEdge, BMFace, BMesh, BMVert
 from bpy.types import Mesh
 
 import utils
 from model import CartographyGroup, CartographyPoint, CartographyRoom
-from utils.blender.bmesh import Geometry
+from utils.blender.bmesh import ColumnIndex, EdgeSet, Geometry, VertexIndex
 from utils.math import Location
 
 # TYPES =======================================================================
@@ -35,6 +35,7 @@ class CartographyMeshGroupContext:
     def __init__(self, mesh: Mesh, bm: BMesh, room: CartographyRoom):
         self.mesh = mesh
         self.bm = bm
+        self.vertex_index = VertexIndex(bm.verts)  # Vertices of BMesh by location, shared by all groups
 
         self.room = room
         self.group: Optional[CartographyGroup] = None
@@ -56,9 +57,14 @@ class CartographyMeshGroupDrawer:
 
     # Constructor -------------------------------------------------------------
     def __init__(self):
+        self._vertex_index: Optional[VertexIndex] = None
         self._vertices: List[BMVert] = []
+        self._vertex_set: Set[BMVert] = set()  # Vertices of group, for check duplicates
+        self._columns = ColumnIndex()  # Vertices of group by 2D position, sorted by z
         self._edges: List[BMEdge] = []
+        self._edge_set = EdgeSet()  # Edges of group by position, for check duplicates and find an edge
         self._based_edges: List[BMEdge] = []
+        self._based_edge_set = EdgeSet()
         self._faces: List[BMFace] = []
 
     # Methods -----------------------------------------------------------------
@@ -79,9 +85,14 @@ class CartographyMeshGroupDrawer:
 
     # Reset
     def _reset(self, context: CartographyMeshGroupContext):
+        self._vertex_index = context.vertex_index
         self._vertices = []
+        self._vertex_set = set()
+        self._columns = ColumnIndex()
         self._edges = []
+        self._edge_set = EdgeSet()
         self._based_edges = []
+        self._based_edge_set = EdgeSet()
         self._faces = []
 
     # Vertices
@@ -92,16 +103,18 @@ class CartographyMeshGroupDrawer:
     def _create_vertex(self, bm: BMesh, point: CartographyPoint, append=True) -> BMVert:
         vertex = self._create_vertex_internal(bm, point.location)
         if append:
-            if vertex in self._vertices:
+            if vertex in self._vertex_set:
                 raise Exception('Duplicated vertex: <{}>', vertex.co)
             self._vertices.append(vertex)
+            self._vertex_set.add(vertex)
+            self._columns.add(vertex)
         return vertex
 
     def _create_vertex_internal(self, bm: BMesh, location: Location) -> BMVert:
-        vertex = utils.blender.bmesh.vert.get(bm, location)
+        vertex = utils.blender.bmesh.vert.get(bm, location, self._vertex_index)
         if not vertex:
             self.__logger.debug('Create vertex: <%s>', str(location))
-            vertex = utils.blender.bmesh.vert.new(bm, location)
+            vertex = utils.blender.bmesh.vert.new(bm, location, self._vertex_index)
         else:
             self.__logger.debug('No create vertex. Already exists in mesh: <%s>', str(location))
         return vertex
@@ -114,11 +127,11 @@ class CartographyMeshGroupDrawer:
     def _create_edge(self, bm: BMesh, vert1: BMVert, vert2: BMVert, based: bool, append=True) -> BMEdge:
         edge = self._create_edge_internal(bm, vert1, vert2)
         if append:
-            if edge in self._edges:
+            if not self._edge_set.add(edge):
                 raise Exception('Duplicated edge: <{}>', [v.co for v in edge.verts])
             self._edges.append(edge)
             if based:
-                if edge in self._based_edges:
+                if not self._based_edge_set.add(edge):
                     raise Exception('Duplicated based edge: <{}>', [v.co for v in edge.verts])
                 self._based_edges.append(edge)
         return edge
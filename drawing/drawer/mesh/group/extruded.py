@@ -137,12 +137,13 @@ class CartographyMeshExtrudedGroupDrawer(CartographyMeshGroupDrawer):
         return extruded
 
     def _build_vertical_edge(self, vert1: BMVert, vert2: BMVert) -> List[BMVert]:
+        # Intermediate vertices of group in the column of vertices
         neg = vert2.co.z < vert1.co.z
-        comp = (lambda v: vert1.co.z > v.co.z > vert2.co.z) if neg else (lambda v: vert1.co.z < v.co.z < vert2.co.z)
-        vertices = [v for v in self._vertices if bmesh_utils.vert.same_2d_position(v, vert1) and comp(v)]
-        vertices.sort(key=lambda v: v.co.z)
         if neg:
+            vertices = self._columns.between(vert1, vert2.co.z, vert1.co.z)
             vertices.reverse()
+        else:
+            vertices = self._columns.between(vert1, vert1.co.z, vert2.co.z)
         return [vert1] + vertices + [vert2]
 
     # Faces - Ground
@@ -3,7 +3,7 @@ Module for leveled of mesh group drawer
 """
 
 import logging
-from typing import Callable, List
+from typing import List
 
 from bmesh.types import BMEdge, BMFace, BMesh, BMVert
 
@@ -11,7 +11,7 @@ import config
 import mappings
 import utils
 from model import CartographyCategory, CartographyGroup, CartographyPoint
-from utils.blender.bmesh import Geometry
+from utils.blender.bmesh import EdgeRing, Geometry
 from .common import CartographyMeshGroupContext, CartographyMeshGroupDrawer
 
 
@@ -24,15 +24,13 @@ class CartographyMeshLeveledGroupDrawer(CartographyMeshGroupDrawer):
     __logger = logging.getLogger('CartographyMeshLeveledGroupDrawer')
 
     # Constructor -------------------------------------------------------------
-    def _init__(self):
+    def __init__(self):
         CartographyMeshGroupDrawer.__init__(self)
 
         self._leveled_material_index: int = 0
         self._climbing_material_index: int = 0
 
         self._outline_vertices: List[BMVert] = []
-        self._top_vertices: List[BMVert] = []
-        self._bottom_vertices: List[BMVert] = []
 
         self._outline_top_edges: List[BMEdge] = []
         self._faced_edges: List[List[BMEdge]] = []
@@ -48,8 +46,6 @@ class CartographyMeshLeveledGroupDrawer(CartographyMeshGroupDrawer):
         self._climbing_material_index = context.get_or_create_material(mappings.cartography_mat_climbing)
 
         self._outline_vertices = []
-        self._top_vertices = []
-        self._bottom_vertices = []
 
         self._outline_top_edges = []
         self._faced_edges = []
@@ -61,22 +57,15 @@ class CartographyMeshLeveledGroupDrawer(CartographyMeshGroupDrawer):
         vertex = CartographyMeshGroupDrawer._create_vertex(self, bm, point)
         if point.has_category(CartographyCategory.OUTLINE):
             self._outline_vertices.append(vertex)
-
-        # Add (or replace) the top/bottom vertices for same 2D position
-        self._append_vertex_to_limits(vertex, self._top_vertices, lambda vertex_z, top_z: vertex_z > top_z)
-        self._append_vertex_to_limits(vertex, self._bottom_vertices, lambda vertex_z, bottom_z: vertex_z < bottom_z)
-
         return vertex
 
-    @staticmethod
-    def _append_vertex_to_limits(vertex: BMVert, limit_vertices: List[BMVert], comp: Callable[[float, float], bool]):
-        predicate = (v for v in limit_vertices if utils.blender.bmesh.vert.same_2d_position(v, vertex))
-        limit_vertex = utils.collection.list.inext(predicate)
-        if not limit_vertex:
-            limit_vertices.append(vertex)
-        elif comp(vertex.co.z, limit_vertex.co.z):
-            limit_vertices.remove(limit_vertex)
-            limit_vertices.append(vertex)
+    def _is_top_vertex(self, vertex: BMVert) -> bool:
+        """If the vertex is the highest of group for its 2D position"""
+        return self._columns.top(vertex) is vertex
+
+    def _is_bottom_vertex(self, vertex: BMVert) -> bool:
+        """If the vertex is the lowest of group for its 2D position"""
+        return self._columns.bottom(vertex) is vertex
 
     # Edges
     def _draw_edges(self, context: CartographyMeshGroupContext):  # overridden
@@ -127,7 +116,7 @@ class CartographyMeshLeveledGroupDrawer(CartographyMeshGroupDrawer):
         if utils.collection.list.contains_all(self._outline_vertices, vertices):
             self.__logger.debug('Faced edges outlined: %s', str([v.co for v in vertices]))
 
-            top_vert1, top_vert2 = [v for v in vertices if v in self._top_vertices]
+            top_vert1, top_vert2 = [v for v in vertices if self._is_top_vertex(v)]
             self.__logger.debug('Create only the top edge: [%s, %s]', str(top_vert1.co), str(top_vert2.co))
             edge = self._get_or_create_faced_edge(bm, top_vert1, top_vert2)
             self._outline_top_edges.append(edge)
@@ -154,10 +143,7 @@ class CartographyMeshLeveledGroupDrawer(CartographyMeshGroupDrawer):
         return faced_edges
 
     def _get_or_create_faced_edge(self, bm: BMesh, vert1: BMVert, vert2: BMVert) -> BMEdge:
-        edge = utils.collection.list.pnext(
-            self._edges,
-            lambda e: utils.blender.bmesh.edge.same_3d_position(e, (vert1, vert2))
-        )
+        edge = self._edge_set.get((vert1, vert2))
         if not edge:
             edge = self._create_edge(bm, vert1, vert2)
         return edge
@@ -170,11 +156,9 @@ class CartographyMeshLeveledGroupDrawer(CartographyMeshGroupDrawer):
 
             start_vert = start_edge.verts[0]  # noqa
             end_vert = end_edge.verts[1]  # noqa
-            ground_outline_edges = utils.collection.list.find_sublist(
-                outline_geom.edges,
-                lambda e: utils.blender.bmesh.vert.same_3d_position(e.verts[0], start_vert),
-                (lambda e: utils.blender.bmesh.vert.same_3d_position(e.verts[1], end_vert), 1)
-            )
+            outline_edges = EdgeRing(outline_geom.edges)
+            start, end = outline_edges.span(start_vert, end_vert)
+            ground_outline_edges = outline_edges[start:end]
 
             count = len(self._outline_top_edges)
             outline_count = len(ground_outline_edges)
@@ -192,8 +176,8 @@ class CartographyMeshLeveledGroupDrawer(CartographyMeshGroupDrawer):
                 self.__logger.debug('Keep outline edges for ground of group: <%s>', group.name)
 
     def _create_edge(self, bm: BMesh, vert1: BMVert, vert2: BMVert, based=False, append=True) -> BMEdge:  # overridden
-        is_top = vert1 in self._top_vertices and vert2 in self._top_vertices
-        is_bottom = vert1 in self._bottom_vertices and vert2 in self._bottom_vertices
+        is_top = self._is_top_vertex(vert1) and self._is_top_vertex(vert2)
+        is_bottom = self._is_bottom_vertex(vert1) and self._is_bottom_vertex(vert2)
 
         edge = CartographyMeshGroupDrawer._create_edge(self, bm, vert1, vert2, is_bottom, append)
         if is_top:
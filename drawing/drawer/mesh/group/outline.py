@@ -8,8 +8,8 @@ from typing import Dict, List, Optional, Tuple
 from bmesh.types import BMEdge, BMesh, BMVert
 
 from model import CartographyCategory, CartographyGroup, CartographyPoint, CartographyRoom
-from utils.blender import bmesh as bmesh_utils
-from utils.collection import list as list_utils, dict as dict_utils
+from utils.blender.bmesh import EdgeRing
+from utils.collection import dict as dict_utils
 from .common import CartographyMeshGroupContext, CartographyMeshGroupGeometry
 from .extruded import CartographyMeshExtrudedGroupDrawer
 
@@ -83,8 +83,9 @@ class CartographyMeshOutlineGroupDrawer(CartographyMeshExtrudedGroupDrawer):
         junction, standalone = self.__split_geoms(context.room, context.geom_by_group)
 
         # Insert junction geometries
+        ring = EdgeRing(edges)  # Changed in place
         for group_name, geom in junction.items():
-            self.__insert_junction_edges(edges, group_name, geom)
+            self.__insert_junction_edges(ring, group_name, geom)
 
         # Add standalone geometries at the end
         for group_name, geom in standalone.items():
@@ -114,26 +115,21 @@ class CartographyMeshOutlineGroupDrawer(CartographyMeshExtrudedGroupDrawer):
 
         return junction, standalone
 
-    def __insert_junction_edges(self, edges: List[BMEdge], group_name: str, geom: CartographyMeshGroupGeometry):
-        # Collect edges in junction
-        junction_edges = []
+    def __insert_junction_edges(self, edges: EdgeRing, group_name: str, geom: CartographyMeshGroupGeometry):
+        # Find edges in junction: edges with a vertex at the location of a vertex of based edges
         based_edges = geom.based_edges
-        for i, edge in enumerate(edges):
-            for based_edge in based_edges:
-                if bmesh_utils.edge.has_3d_junction(edge, based_edge):
-                    junction_edges.append(edge)
+        positions = edges.touching(v for e in based_edges for v in e.verts)
 
         # Remove outline edges in collision and insert based edges of geometry
-        if junction_edges:
-            start_index = edges.index(junction_edges[0]) + 1
-            end_index = edges.index(junction_edges[len(junction_edges) - 1])
+        if positions:
+            start_index = positions[0] + 1
+            end_index = positions[-1]
             if start_index < end_index:
                 self.__logger.debug(
                     'Replace <%d> outline edges by <%d> based edges from group <%s>',
                     end_index - start_index, len(based_edges), group_name
                 )
-                list_utils.remove_sublist(edges, start_index, end_index)
-                list_utils.insert_values(edges, start_index, based_edges)
+                edges.splice(start_index, end_index, based_edges)
             else:
                 # TODO
                 print('TODO')
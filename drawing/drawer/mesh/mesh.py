@@ -15,6 +15,7 @@ from model import CartographyCategoryType, CartographyObjectType, CartographyRoo
 from templating import CartographyTemplate
 from .group import CartographyMeshGroupContext, CartographyMeshGroupGeometry, CartographyMeshOutlineGroupDrawer, \
     CartographyMeshExtrudedGroupDrawer, CartographyMeshLeveledGroupDrawer
+from . import validation
 from ..common import CartographyRoomDrawer
 
 
@@ -44,7 +45,7 @@ class CartographyMeshDrawer(CartographyRoomDrawer):
 
         # Create object
         name = room.name + '_plane'
-        obj = utils.blender.object.create(name, Vector((0, 0, 0)), template, collection)
+        obj = utils.blender.object.create(name, Vector((0, 0, 0)), template, collection, True)
 
         # Create and clean BMesh
         mesh = utils.blender.object.get_mesh(obj)
@@ -84,7 +85,7 @@ class CartographyMeshDrawer(CartographyRoomDrawer):
         if drawer:
             try:
                 geom = drawer.draw(context)
-                self.__check_group_geom(geom)
+                validation.validate(geom)
             except Exception as err:
                 raise Exception('Failed to draw group <{}>', group.name).with_traceback(err.__traceback__)
         else:
@@ -92,21 +93,3 @@ class CartographyMeshDrawer(CartographyRoomDrawer):
             geom = CartographyMeshGroupGeometry()
 
         return geom
-
-    @staticmethod
-    def __check_group_geom(geom: CartographyMeshGroupGeometry):
-        for vert in geom.vertices:
-            duplicated = [v for v in geom.vertices if utils.blender.bmesh.vert.same_3d_position(v, vert)]
-            count = len(duplicated)
-            if count > 1:
-                raise Exception('Duplicated vertex <{}>: <{}> times', vert.co, count)
-
-        edges_dict = {'': geom.edges, 'based': geom.based_edges}
-        for name, edges in edges_dict.items():
-            for edge in edges:
-                duplicated = [e for e in edges if utils.blender.bmesh.edge.same_3d_position(e, edge)]
-                count = len(duplicated)
-                if count > 1:
-                    raise Exception('Duplicated ' + name + ' edge <{}>: <{}> times', [v.co for v in edge.verts], count)
-
-        # TODO check faces ?
@@ -0,0 +1,72 @@
+"""
+Module for validation of geometry drawn by mesh drawer (level: see config.geom_validation)
+"""
+
+import logging
+from collections import Counter
+from typing import Optional
+
+import config
+import utils
+from utils.blender.bmesh import EdgeSet
+from .group import CartographyMeshGroupGeometry
+
+# VARIABLES ===================================================================
+levels = config.geom_validation_levels  # off: nothing, fast: duplicates, full: duplicates and invalid faces/edges
+__logger = logging.getLogger('CartographyMeshValidation')
+
+
+# METHODS =====================================================================
+def validate(geom: CartographyMeshGroupGeometry, level: Optional[str] = None):
+    """
+    Validate the geometry of a group. An exception is thrown for duplicated vertices/edges, the invalid faces and edges
+    are only logged.
+
+    :param geom Geometry of group (with based edges)
+    :param level Level of validation (optional, config.geom_validation by default)
+    """
+    level = level or config.geom_validation
+    check_level(level)
+    if level == 'off':
+        return
+
+    check_duplicates(geom)
+    if level == 'full':
+        check_faces(geom)
+        check_edges(geom)
+
+
+def check_level(level: str):
+    """Check a level of validation (an exception is thrown if unknown)"""
+    if level not in levels:
+        raise Exception('Unknown validation level: <{}>. Expected: <{}>'.format(level, '|'.join(levels)))
+
+
+def check_duplicates(geom: CartographyMeshGroupGeometry):
+    """Check the vertices and edges at the same position (count of positions in hash tables)"""
+    counts = Counter(utils.blender.bmesh.vert.location_key(v) for v in geom.vertices)
+    for vert in geom.vertices:
+        count = counts[utils.blender.bmesh.vert.location_key(vert)]
+        if count > 1:
+            raise Exception('Duplicated vertex <{}>: <{}> times', vert.co, count)
+
+    edges_dict = {'': geom.edges, 'based': geom.based_edges}
+    for name, edges in edges_dict.items():
+        for edge, count in EdgeSet(edges).counts():
+            if count > 1:
+                raise Exception('Duplicated ' + name + ' edge <{}>: <{}> times', [v.co for v in edge.verts], count)
+
+
+def check_faces(geom: CartographyMeshGroupGeometry):
+    """Log the degenerate faces: less than 3 distinct positions or no area"""
+    for face in geom.faces:
+        positions = {utils.blender.bmesh.vert.location_key(v) for v in face.verts}
+        if len(positions) < 3 or face.calc_area() <= 0:
+            __logger.warning('Degenerate face: <%s>', [v.co for v in face.verts])
+
+
+def check_edges(geom: CartographyMeshGroupGeometry):
+    """Log the non-manifold edges: linked to more than 2 faces"""
+    for edge in geom.edges:
+        if len(edge.link_faces) > 2:
+            __logger.warning('Non-manifold edge: <%s> (%d faces)', [v.co for v in edge.verts], len(edge.link_faces))
@@ -6,15 +6,23 @@ import utils
 # VARIABLES ===================================================================
 __name = 'main'
 __logger = logging.getLogger(__name)
-__actions = [
+__actions = [a for a in (
+    action.build_map,
     action.calculate_coordinates,
-    action.generate_blender_file
-]
+    action.generate_blender_file,
+    action.serve
+) if a]
 
 # ARGUMENTS ===================================================================
 utils.args.add('-a', '--action', str, 'Launch a main action directly')
 utils.args.add('-f', '--file', str, 'File with coordinates')
-utils.args.add('-o', '--output', str, 'Name of file to write')
+utils.args.add('-o', '--output', str, 'Name of file to write (directory in batch mode)')
+utils.args.add('-b', '--batch', str, 'Directory or glob pattern of files (batch mode)')
+utils.args.add('-j', '--jobs', int, 'Number of parallel jobs (batch mode)')
+utils.args.add('-x', '--blender', str, 'Blender executable for workers (build_map action)')
+utils.args.add('-p', '--port', int, 'Port of local server of jobs (serve action)')
+utils.args.add('-c', '--validation', str, 'Validation of geometry: off, fast or full (generate_blender_file action)')
+utils.args.add_flag('-w', '--worker', 'Wait jobs on standard input (generate_blender_file action)')
 args = utils.args.parse()
 
 
@@ -2,9 +2,11 @@
 Mappings for parsing
 """
 
-from typing import List
+import threading
+from typing import Dict, List
 
 import config
+import utils
 from model import CartographyCategory, CartographyInterestType, CartographyObjectType
 
 
@@ -17,37 +19,6 @@ def __build_regex(words: List[str], has_number: bool) -> str:
 # Cartography: join word for name concatenation
 cartography_point_name_join = ' - '
 
-# Type of cartography points
-__category_words = config.mappings.words['category']
-cartography_point_category = {
-    # Structure
-    __build_regex(__category_words['OUTLINE'], False): CartographyCategory.OUTLINE,
-    __build_regex(__category_words['GATE'], True): CartographyCategory.GATE,
-    __build_regex(__category_words['ESCARPMENT'], True): CartographyCategory.ESCARPMENT,
-    __build_regex(__category_words['BASEMENT'], True): CartographyCategory.BASEMENT,
-    __build_regex(__category_words['LANDING'], True): CartographyCategory.LANDING,
-    __build_regex(__category_words['COLUMN'], True): CartographyCategory.COLUMN,
-    __build_regex(__category_words['COLUMN_BASE'], True): CartographyCategory.COLUMN_BASE,
-    __build_regex(__category_words['CHASM'], True): CartographyCategory.CHASM,
-    # Interest
-    __build_regex(__category_words['CLIMBING_POINT'], False): CartographyCategory.CLIMBING_POINT,
-    __build_regex(__category_words['HARVESTABLE'], False): CartographyCategory.HARVESTABLE,
-    __build_regex(__category_words['ANTHROPOGENIC_OBJECT'], False): CartographyCategory.ANTHROPOGENIC_OBJECT,
-    __build_regex(__category_words['BANK'], False): CartographyCategory.BANK,
-    __build_regex(__category_words['STRUCTURE'], False): CartographyCategory.STRUCTURE
-}
-
-# Cartography: pattern for determinate a junction
-cartography_junction_pattern = '(Jonction|Junction) .+ (' + '|'.join(cartography_point_category.keys()) + ')'
-
-# Type of cartography interest
-__category_words = config.mappings.words['interest_type']
-cartography_interest_type = {
-    __build_regex(__category_words['LITTLE_BOX'], False): CartographyInterestType.LITTLE_BOX,
-    __build_regex(__category_words['LICHEN'], False): CartographyInterestType.LICHEN,
-    __build_regex(__category_words['ORE'], False): CartographyInterestType.ORE
-}
-
 # Type of cartography points
 cartography_object_type = {
     # Point categories
@@ -74,3 +45,80 @@ cartography_object_type = {
 # Material for specific items
 cartography_mat_wall = 'rock_cliff'
 cartography_mat_climbing = 'escalade'
+
+
+# CONFIG - WORDS ==============================================================
+# Built from words of config.mappings (built again by update() if the words changed)
+cartography_point_category: Dict[str, CartographyCategory] = {}  # Type of cartography points
+cartography_category_pattern: Dict[CartographyCategory, str] = {}  # Pattern by type of cartography points
+cartography_junction_pattern = ''  # Cartography: pattern for determinate a junction
+cartography_interest_type: Dict[str, CartographyInterestType] = {}  # Type of cartography interest
+# Keywords of categories and interest types: candidates to verify with their patterns
+cartography_keywords = utils.automaton.KeywordAutomaton()
+words_version = None  # Version of words used
+__lock = threading.Lock()  # For build only once when many parsers update the mappings
+
+
+def build():
+    """Build the mappings from words of config.mappings"""
+    global cartography_point_category, cartography_category_pattern, cartography_junction_pattern, \
+        cartography_interest_type, cartography_keywords, words_version
+
+    category_words = config.mappings.words['category']
+    cartography_point_category = {
+        # Structure
+        __build_regex(category_words['OUTLINE'], False): CartographyCategory.OUTLINE,
+        __build_regex(category_words['GATE'], True): CartographyCategory.GATE,
+        __build_regex(category_words['ESCARPMENT'], True): CartographyCategory.ESCARPMENT,
+        __build_regex(category_words['BASEMENT'], True): CartographyCategory.BASEMENT,
+        __build_regex(category_words['LANDING'], True): CartographyCategory.LANDING,
+        __build_regex(category_words['COLUMN'], True): CartographyCategory.COLUMN,
+        __build_regex(category_words['COLUMN_BASE'], True): CartographyCategory.COLUMN_BASE,
+        __build_regex(category_words['CHASM'], True): CartographyCategory.CHASM,
+        # Interest
+        __build_regex(category_words['CLIMBING_POINT'], False): CartographyCategory.CLIMBING_POINT,
+        __build_regex(category_words['HARVESTABLE'], False): CartographyCategory.HARVESTABLE,
+        __build_regex(category_words['ANTHROPOGENIC_OBJECT'], False): CartographyCategory.ANTHROPOGENIC_OBJECT,
+        __build_regex(category_words['BANK'], False): CartographyCategory.BANK,
+        __build_regex(category_words['STRUCTURE'], False): CartographyCategory.STRUCTURE
+    }
+
+    cartography_category_pattern = {c: p for p, c in cartography_point_category.items()}
+
+    cartography_junction_pattern = '(Jonction|Junction) .+ (' + '|'.join(cartography_point_category.keys()) + ')'
+
+    interest_words = config.mappings.words['interest_type']
+    cartography_interest_type = {
+        __build_regex(interest_words['LITTLE_BOX'], False): CartographyInterestType.LITTLE_BOX,
+        __build_regex(interest_words['LICHEN'], False): CartographyInterestType.LICHEN,
+        __build_regex(interest_words['ORE'], False): CartographyInterestType.ORE
+    }
+
+    keywords = utils.automaton.KeywordAutomaton()
+    for category in cartography_point_category.values():
+        for word in category_words[category.name]:
+            keywords.add(category, word)
+    for interest_type in cartography_interest_type.values():
+        for word in interest_words[interest_type.name]:
+            keywords.add(interest_type, word)
+    keywords.build()  # Built before use: the search of parsers (many threads) only reads it
+    cartography_keywords = keywords
+
+    words_version = config.mappings.version
+
+
+def update() -> bool:
+    """
+    Read the words of config.mappings again if the JSON file was changed, and build the mappings if needed.
+
+    :return If the mappings were built
+    """
+    with __lock:
+        config.mappings.reload_if_changed()
+        if words_version == config.mappings.version:
+            return False
+        build()
+        return True
+
+
+build()
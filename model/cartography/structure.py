@@ -1,9 +1,9 @@
 """
 Module for structure cartography models
 """
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
 
-from mathutils import Vector
+from utils.math import Vector
 
 import utils
 from .common import CartographyInterestType, CartographyCategory
@@ -12,6 +12,8 @@ from .common import CartographyInterestType, CartographyCategory
 # CLASSES =====================================================================
 class CartographyPoint:
     """Point used for cartography"""
+    __slots__ = ('name', 'comments', 'category', 'location', 'observations', 'interest', 'additional_categories',
+                 'copy')
 
     # Constructor -------------------------------------------------------------
     def __init__(
@@ -19,18 +21,18 @@ class CartographyPoint:
             name: str = None,
             comments: str = None,
             category: CartographyCategory = None,
-            location: Vector = Vector((0, 0, 0)),
+            location: Optional[Vector] = None,
             observations: List[str] = None,
             interest: Optional[Tuple[CartographyInterestType, int]] = None,
-            additional_categories: List[CartographyCategory] = []  # noqa
+            additional_categories: List[CartographyCategory] = None
     ):
         self.name: str = name
         self.comments: List[str] = comments or []
         self.category = category
-        self.location = location
+        self.location = location if location is not None else Vector((0, 0, 0))
         self.observations = observations or []
         self.interest = interest
-        self.additional_categories = additional_categories
+        self.additional_categories = additional_categories or []
         self.copy = False
 
     # Methods -----------------------------------------------------------------
@@ -49,6 +51,7 @@ class CartographyPoint:
 
 class CartographyGroup:
     """Group of cartography points"""
+    __slots__ = ('name', 'category', 'points', 'linked')
 
     # Constructor -------------------------------------------------------------
     def __init__(self, name: str, category: CartographyCategory, linked: List[any] = None):
@@ -66,27 +69,39 @@ class CartographyGroup:
 
 
 class CartographyJunction:
-    """Junction points between two groups"""
+    """Junction points between two groups (pairs of points stored once, points of each group are views)"""
+    __slots__ = ('groups', 'points', '__locations')
 
     # Constructor -------------------------------------------------------------
     def __init__(self, group1: CartographyGroup, group2: CartographyGroup):
-        self.group1 = group1
-        self.group2 = group2
         self.groups = (group1, group2)
-
-        self.points1: List[CartographyPoint] = []
-        self.points2: List[CartographyPoint] = []
         self.points: List[Tuple[CartographyPoint, CartographyPoint]] = []
+        self.__locations: Set[Tuple[float, ...]] = set()  # Locations of all points
 
     # Methods -----------------------------------------------------------------
+    @property
+    def group1(self) -> CartographyGroup:
+        return self.groups[0]
+
+    @property
+    def group2(self) -> CartographyGroup:
+        return self.groups[1]
+
+    @property
+    def points1(self) -> List[CartographyPoint]:
+        return [p1 for p1, p2 in self.points]
+
+    @property
+    def points2(self) -> List[CartographyPoint]:
+        return [p2 for p1, p2 in self.points]
+
     def add_points(self, point1: CartographyPoint, point2: CartographyPoint):
-        self.points1.append(point1)
-        self.points2.append(point2)
         self.points.append((point1, point2))
+        self.__locations.add(tuple(point1.location))
+        self.__locations.add(tuple(point2.location))
 
     def has_point(self, point: CartographyPoint):
-        loc = point.location
-        return utils.collection.list.pnext(self.points, lambda p: loc in [p.location for p in p]) is not None
+        return tuple(point.location) in self.__locations
 
     def __repr__(self):
         return utils.object.to_repr(self)
@@ -105,6 +120,10 @@ class CartographyRoom:
         self.outline_group: Optional[CartographyGroup] = None
         self.junctions: List[CartographyJunction] = []
 
+        # Indexes of junctions: first junction by pair of groups, junctions by group (in order of addition)
+        self.__junctions_by_pair: Dict[FrozenSet[CartographyGroup], CartographyJunction] = {}
+        self.__junctions_by_group: Dict[CartographyGroup, List[CartographyJunction]] = {}
+
     # Methods -----------------------------------------------------------------
     @property
     def all_points(self) -> List[CartographyPoint]:
@@ -113,16 +132,22 @@ class CartographyRoom:
     def add_junction(self, group1: CartographyGroup, group2: CartographyGroup) -> CartographyJunction:
         junction = CartographyJunction(group1, group2)
         self.junctions.append(junction)
+
+        self.__junctions_by_pair.setdefault(frozenset((group1, group2)), junction)
+        for group in ((group1,) if group1 is group2 else (group1, group2)):
+            self.__junctions_by_group.setdefault(group, []).append(junction)
         return junction
 
     def get_junction(self, group1: CartographyGroup, group2: CartographyGroup) -> CartographyJunction:
-        return utils.collection.list.pnext(self.junctions, lambda j: group1 in j.groups and group2 in j.groups)
+        """Get the first junction between two groups (the first junction of group if both groups are the same)"""
+        if group1 is group2:
+            return utils.collection.list.inext(iter(self.__junctions_by_group.get(group1, [])))
+        return self.__junctions_by_pair.get(frozenset((group1, group2)))
 
     def has_junction(self, group1: CartographyGroup, group2: Optional[CartographyGroup] = None) -> bool:
-        predicate = (lambda j: group1 in j.groups) \
-            if not group2 \
-            else (lambda j: group1 in j.groups and group2 in j.groups)
-        return utils.collection.list.pnext(self.junctions, predicate) is not None
+        if not group2:
+            return bool(self.__junctions_by_group.get(group1))
+        return self.get_junction(group1, group2) is not None
 
     def __repr__(self):
         return utils.object.to_repr(self)
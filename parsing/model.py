@@ -2,10 +2,14 @@
 Module for private entities relative to parsing
 """
 
+import logging
+import re
 from logging import Logger
-from typing import Optional, Dict
+from typing import Dict, List, Optional, Tuple
 
-from model import CartographyGroup, CartographyPoint, CartographyRoom
+import mappings
+import utils
+from model import CartographyCategory, CartographyGroup, CartographyInterestType, CartographyPoint, CartographyRoom
 
 
 # CLASSES =====================================================================
@@ -27,11 +31,110 @@ class JunctionGroup:
         self.end: Optional[CartographyParser.__PointGroupTuple] = None  # noqa
 
 
+class ObservationCategory:
+    """Category found in observations, with the analysis of its observation (text matched by the category)"""
+
+    def __init__(self, category: CartographyCategory, observation: str, proximity: bool = False):
+        self.category = category
+        self.observation = observation
+        self.proximity = proximity  # If found after a proximity word
+
+        # Number of category (ex: "Gate 2"), None if no number in pattern of category
+        self.number: Optional[int] = None
+        # Categories found in the observation with their text (for determinate the group)
+        self.categories: List[Tuple[CartographyCategory, str]] = []
+        # Interest type and count found in the observation
+        self.interest: Optional[Tuple[CartographyInterestType, int]] = None
+        # Junction target found in the observation: name (category with optional number) and its category
+        self.junction: Optional[Tuple[str, CartographyCategory]] = None
+
+    def __repr__(self):
+        return utils.object.to_repr(self)
+
+    def __str__(self):
+        return utils.object.to_str(self)
+
+
+class ObservationAnalysis:
+    """Analysis of observations of a file point (done once, used by all steps of parsing)"""
+
+    def __init__(self, observations: List[str]):
+        self.observations = observations
+        self.categories: List[ObservationCategory] = []  # By category then by observation
+
+    def get_category(self, categories_to_ignore: List[CartographyCategory]) -> Tuple[CartographyCategory, str]:
+        """Get the first category found not ignored (the first category if all are ignored), with its observation"""
+        item = utils.collection.list.pnext(self.categories, lambda c: c.category not in categories_to_ignore)
+        item = item or self.categories[0]
+        return item.category, item.observation
+
+    def __repr__(self):
+        return utils.object.to_repr(self)
+
+    def __str__(self):
+        return utils.object.to_str(self)
+
+
+class GroupIndex:
+    """Index of groups of a room: by category and normalized name, and by category and number"""
+
+    # Fields ------------------------------------------------------------------
+    __logger = logging.getLogger('GroupIndex')
+    __number_pattern = re.compile(' ([0-9]+)$')
+
+    # Constructor -------------------------------------------------------------
+    def __init__(self):
+        self.__by_name: Dict[Tuple[CartographyCategory, str], CartographyGroup] = {}
+        self.__by_number: Dict[Tuple[CartographyCategory, int], List[CartographyGroup]] = {}
+
+    # Methods -----------------------------------------------------------------
+    def add(self, group: CartographyGroup):
+        name = self.normalize(group.name)
+        self.__by_name.setdefault((group.category, name), group)
+        m = self.__number_pattern.search(name)
+        if m:
+            self.__by_number.setdefault((group.category, int(m.group(1))), []).append(group)
+
+    def find(self, category: CartographyCategory, name: str) -> Optional[CartographyGroup]:
+        """
+        Find a group by its name (ex: "colonne 3"), or by its number if only one group of category has this number and
+        if the name is a word of category with a number in mappings (ex: "pilier 3" for "Colonne 3", not "pont 3").
+
+        :param category Category of group
+        :param name Name of group
+        :return Group found (None if not found)
+        """
+        normalized_name = self.normalize(name)
+        group = self.__by_name.get((category, normalized_name))
+        if group is None:
+            m = self.__number_pattern.search(normalized_name)
+            pattern = mappings.cartography_category_pattern.get(category)
+            if m and pattern and utils.string.match_ignore_case(pattern + '$', ' '.join(name.split())):
+                groups = self.__by_number.get((category, int(m.group(1))), [])
+                group = groups[0] if len(groups) == 1 else None
+                if group:
+                    self.__logger.debug('Group <%s> found by number for name <%s>', group.name, name)
+        return group
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Normalize a group name: folded (lower case without accents) and with single spaces"""
+        return ' '.join(utils.automaton.fold(name).split())
+
+    def __repr__(self):
+        return utils.object.to_repr(self)
+
+    def __str__(self):
+        return utils.object.to_str(self)
+
+
 class ParseContext:
     """Context for CartographyParser"""
 
     def __init__(self, logger: Logger):
         self.room: Optional[CartographyRoom] = None
+        self.groups = GroupIndex()  # Index of groups of room
         self.row: int = 0
         self.junctions: Dict[str, JunctionGroup] = {}
+        self.junction_targets: Dict[CartographyPoint, Tuple[str, CartographyCategory]] = {}  # By point (identity)
         self.logger: Logger = logger
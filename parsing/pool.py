@@ -0,0 +1,90 @@
+"""
+Module for reading and parsing of many files in a pool of processes (the rooms are drawn while the others are parsed)
+"""
+
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+from model import CartographyRoom
+from reading import CartographyCsvReader, CartographyTsvReader
+from utils.math import Vector
+from .parser import CartographyParser
+
+# VARIABLES ===================================================================
+__logger = logging.getLogger('Parsing pool')
+
+
+# METHODS =====================================================================
+def parse_files(filepaths: List[os.path], workers: Optional[int] = None) \
+        -> Iterator[Tuple[os.path, Optional[CartographyRoom], Optional[str]]]:
+    """
+    Read and parse many CSV files in a pool of processes.<br />
+    NB: the rooms are given in order of files as soon as they are parsed, so the next files are parsed while a room is
+    used (drawn) by the caller. With only one worker, the files are parsed one by one in the current process.
+
+    :param filepaths Files to read and parse
+    :param workers Number of processes (optional, number of processors by default)
+    :return Generator of file, room (None if failed) and error (None if success)
+    """
+    workers = max(min(workers or os.cpu_count() or 1, len(filepaths)), 1)
+    if workers == 1:
+        for filepath in filepaths:
+            yield (filepath,) + read_and_parse(filepath)
+        return
+
+    __logger.info('Parse <%d> files with <%d> processes...', len(filepaths), workers)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(read_and_parse, filepath, True) for filepath in filepaths]
+        for filepath, future in zip(filepaths, futures):
+            try:
+                room, error = future.result()
+            except Exception as err:  # Process of pool stopped or result not readable
+                room, error = None, '{}: {}'.format(type(err).__name__, err)
+            yield filepath, (unpack_room(room) if room else None), error
+
+
+def read_and_parse(filepath: os.path, packed=False) -> Tuple[Optional[CartographyRoom], Optional[str]]:
+    """
+    Read and parse a CSV file (function executed by the processes of pool).
+
+    :param filepath File to read and parse
+    :param packed If the room must be packed for be sent to another process (see pack_room)
+    :return Room (None if failed) and error (None if success)
+    """
+    try:
+        filename, extension = os.path.splitext(filepath)
+        reader = CartographyTsvReader() if extension.lower() == '.tsv' else CartographyCsvReader('\t')
+        room = CartographyParser().parse(reader.read(filepath))
+    except Exception as err:  # Exceptions of reader/parser aren't always readable by another process
+        __logger.error('Failed to parse <%s>', filepath, exc_info=err)
+        return None, '{}: {}'.format(type(err).__name__, err)
+    return (pack_room(room) if packed else room), None
+
+
+def pack_room(room: CartographyRoom) -> CartographyRoom:
+    """Replace the locations of points by tuples, for a room readable by another process (without mathutils)"""
+    for point in __all_points(room):
+        point.location = tuple(point.location)
+    return room
+
+
+def unpack_room(room: CartographyRoom) -> CartographyRoom:
+    """Restore the locations of points of a packed room as vectors"""
+    for point in __all_points(room):
+        point.location = Vector(point.location)
+    return room
+
+
+# METHODS - INTERNAL ==========================================================
+def __all_points(room: CartographyRoom):
+    # Points of groups and of junctions, each point only once (the same point can be in many lists)
+    points = {}
+    for point in room.all_points:
+        points[id(point)] = point
+    for junction in room.junctions:
+        for point1, point2 in junction.points:
+            points[id(point1)] = point1
+            points[id(point2)] = point2
+    return points.values()
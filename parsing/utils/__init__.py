@@ -1,2 +1,2 @@
-from . import category, common, group, junction
+from . import category, common, group, junction, observation
 from . import junction_old
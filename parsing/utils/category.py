@@ -3,6 +3,7 @@ Module for category methods relative to parsing
 """
 
 import re
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import config
@@ -13,6 +14,67 @@ from ..exception import CartographyParserException
 from ..model import ParseContext
 
 
+# CLASSES =====================================================================
+class CartographyCategoryMatcher:
+    """
+    Matcher of all categories in an observation with only one scan of keyword automaton.<br />
+    For each category, the exact pattern is tried first then the pattern preceded by a proximity guard (as
+    match_category_in_observation). The variants are compiled once and only the categories with a keyword found at
+    start of observation (or after the space of proximity variant) are verified with their variants.
+    """
+
+    # Constructor -------------------------------------------------------------
+    def __init__(
+            self,
+            categories: Tuple[Tuple[str, CartographyCategory], ...],
+            proximity_words: Tuple[str, ...],
+            keywords: utils.automaton.KeywordAutomaton
+    ):
+        self.categories = categories
+        self.keywords = keywords
+        self.__variants = [compile_category(pattern, proximity_words) for pattern, category in categories]
+        # Categories always verified: without keywords or with keywords not expandable in literals
+        self.__verified_categories = {c for p, c in categories if c not in keywords.keys} | keywords.fallback_keys
+
+    # Methods -----------------------------------------------------------------
+    def match(self, parts: List[str]) -> List[Tuple[CartographyCategory, re.Match]]:
+        """
+        Match the categories in observation parts.
+
+        :param parts Observation parts
+        :return Categories found with their match result, by category then by part
+        """
+        found = [[] for _ in self.categories]
+        for part in parts:
+            for i, m in self.match_part(part):
+                found[i].append(m)
+        return [(category, m) for (pattern, category), matches in zip(self.categories, found) for m in matches]
+
+    def match_part(self, part: str, hits: Optional[List[Tuple[int, int, any]]] = None) -> List[Tuple[int, re.Match]]:
+        """
+        Match the categories in one observation part.
+
+        :param part Observation part
+        :param hits Keywords found in part (optional, searched by default)
+        :return Index of categories found (in categories) with their match result
+        """
+        hits = self.keywords.search(part) if hits is None else hits
+        candidates = {key for start, end, key in hits if start <= 1} | self.__verified_categories
+
+        found = []
+        for i, (pattern, category) in enumerate(self.categories):
+            if category in candidates:
+                exact, proximity = self.__variants[i]
+                m = exact.match(part) or proximity.match(part)
+                if m:
+                    found.append((i, m))
+        return found
+
+    def is_proximity(self, m: re.Match) -> bool:
+        """If a match result was found with the proximity variant of its category"""
+        return utils.collection.list.pnext(self.__variants, lambda v: v[1] is m.re) is not None
+
+
 # METHODS =====================================================================
 def parse_categories(values: List[str] or str, required=False) -> List[Tuple[CartographyCategory, re.Match]]:
     """
@@ -23,14 +85,8 @@ def parse_categories(values: List[str] or str, required=False) -> List[Tuple[Car
     :param required If an exception must be thrown if not category found
     :return List of categories found
     """
-    categories = []
-
     parts = (values if isinstance(values, list) else values.split(config.obs_separator))
-    for pattern, category in mappings.cartography_point_category.items():
-        for part in parts:
-            m = __match_category_in_observation(pattern, part)
-            if m:
-                categories.append((category, m))
+    categories = get_matcher().match(parts)
 
     if not categories and required:
         raise CartographyParserException(
@@ -43,15 +99,33 @@ def parse_categories(values: List[str] or str, required=False) -> List[Tuple[Car
     return categories
 
 
-def __match_category_in_observation(pattern: str, value: str) -> re.Match:
-    m = utils.string.match_ignore_case(pattern, value, True)
-    if not m:
-        pattern = '(?!(' + '|'.join(config.mappings.words['proximity']) + ').)* ' + pattern
-        m = utils.string.match_ignore_case(pattern, value, True)
-        if not m:
-            pattern += '.*'
-            m = utils.string.match_ignore_case(pattern, value, True)
-    return m
+def match_category_in_observation(pattern: str, value: str) -> re.Match:
+    """Match a category pattern in an observation, exactly or preceded by a proximity guard"""
+    exact, proximity = compile_category(pattern, tuple(config.mappings.words['proximity']))
+    return exact.match(value) or proximity.match(value)
+
+
+def get_matcher() -> CartographyCategoryMatcher:
+    """Get the matcher of categories of mappings (built once)"""
+    return __build_matcher(
+        tuple(mappings.cartography_point_category.items()),
+        tuple(config.mappings.words['proximity']),
+        mappings.cartography_keywords
+    )
+
+
+@lru_cache(maxsize=1024)
+def compile_category(pattern: str, proximity_words: Tuple[str, ...]) -> Tuple[re.Pattern, re.Pattern]:
+    """
+    Compile (once) the variants of a category pattern.<br />
+    NB: the pattern with '.*' at end isn't compiled, it can match only if the proximity variant matches.
+
+    :param pattern Category pattern
+    :param proximity_words Words of proximity
+    :return Exact variant and proximity variant
+    """
+    proximity_pattern = '(?!(' + '|'.join(proximity_words) + ').)* ' + pattern
+    return utils.string.compile_ignore_case(pattern)[0], utils.string.compile_ignore_case(proximity_pattern)[0]
 
 
 # FIXME deprecated ?
@@ -86,3 +160,13 @@ def parse_point_category(
             '|'.join(mappings.cartography_point_category.keys())
         )
     return dft_value, None
+
+
+# METHODS - INTERNAL ==========================================================
+@lru_cache(maxsize=8)
+def __build_matcher(
+        categories: Tuple[Tuple[str, CartographyCategory], ...],
+        proximity_words: Tuple[str, ...],
+        keywords: utils.automaton.KeywordAutomaton
+) -> CartographyCategoryMatcher:
+    return CartographyCategoryMatcher(categories, proximity_words, keywords)
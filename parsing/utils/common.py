@@ -3,7 +3,7 @@ Module for common methods relative to parsing
 """
 
 from copy import copy
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import mappings
 import utils
@@ -11,9 +11,25 @@ from model import CartographyInterestType, CartographyPoint
 
 
 # METHODS =====================================================================
-def check_interest(value: str, dft_value: Optional[Tuple[CartographyInterestType, int]] = None) \
-        -> Tuple[Optional[CartographyInterestType], int]:
+def check_interest(
+        value: str,
+        dft_value: Optional[Tuple[CartographyInterestType, int]] = None,
+        hits: Optional[List[Tuple[int, int, any]]] = None
+) -> Tuple[Optional[CartographyInterestType], int]:
+    """
+    Get the interest type (with count) of a value.
+
+    :param value Value to check
+    :param dft_value Value to return if no interest type found (optional, None by default)
+    :param hits Keywords found in value (optional, searched by default), only the interest types found are verified
+    :return Interest type with count
+    """
+    keywords = mappings.cartography_keywords
+    hits = keywords.search(value) if hits is None else hits
+    candidates = {key for start, end, key in hits} | keywords.fallback_keys
     for pattern, interest in mappings.cartography_interest_type.items():
+        if interest in keywords.keys and interest not in candidates:
+            continue
         # FIXME '(([0-9]+) )?' not working :(
         m = utils.string.match_ignore_case('([0-9]+) ' + pattern, value, False)
         if m:
@@ -5,16 +5,20 @@ Module for treat groups
 import re
 from typing import List, Optional, Tuple
 
-import config
 import utils
 from model import CartographyCategory, CartographyGroup, CartographyRoom
-from parsing.model import ParseContext
+from parsing.model import ObservationCategory, ParseContext
 from . import category as category_utils
 
 
 # METHODS =====================================================================
 def find(context: ParseContext, partial_name: str, category: CartographyCategory, room: CartographyRoom) \
         -> Optional[CartographyGroup]:
+    """Find a group by category and name: in index of groups first, then by partial name in all groups of room"""
+    group = context.groups.find(category, partial_name) if room is context.room else None
+    if group:
+        return group
+
     groups = [
         g for g in room.groups.values()
         if g.category == category and utils.string.match_ignore_case(partial_name, g.name, False)
@@ -26,8 +30,9 @@ def find(context: ParseContext, partial_name: str, category: CartographyCategory
     return groups[0] if count == 1 else None
 
 
-def get_or_create(context: ParseContext, observations: List[str]) -> CartographyGroup:
-    name, category = __determinate_group_name_category(context, observations)
+def get_or_create(context: ParseContext, item: ObservationCategory) -> CartographyGroup:
+    """Get or create the group of a category found in observations (from the analysis of its observation)"""
+    name, category = __determinate_group_name_category(context, item.observation, item.categories)
     group = context.room.groups.get(name, None)
     if not group:
         if category.outline:
@@ -36,6 +41,7 @@ def get_or_create(context: ParseContext, observations: List[str]) -> Cartography
             context.logger.debug('Create new group <%s>', name)
             group = CartographyGroup(name, category)
             context.room.groups[name] = group
+            context.groups.add(group)
 
             if category.outline:
                 context.room.outline_group = group
@@ -44,46 +50,39 @@ def get_or_create(context: ParseContext, observations: List[str]) -> Cartography
     return group
 
 
-def __determinate_group_name_category(context, observations: List[str]) -> Tuple[str, CartographyCategory]:
-    categories = category_utils.parse_categories(observations)
+def __determinate_group_name_category(
+        context,
+        observation: str,
+        categories: List[Tuple[CartographyCategory, str]]
+) -> Tuple[str, CartographyCategory]:
     if len(categories) == 0:
         category = CartographyCategory.UNKNOWN
         name = category.name
         context.logger.warning(
             'Category not found in <%s>. Use category: <%s>',
-            config.obs_separator.join(observations), category.name
+            observation, category.name
         )
     elif len(categories) > 1:
-        category_types = [c for c, m in categories]
+        category_types = [c for c, n in categories]
         if CartographyCategory.OUTLINE in category_types and CartographyCategory.GATE in category_types:
             category = CartographyCategory.OUTLINE
             name = category.name
         else:
-            category, cat_match = categories[0]
-            name = cat_match.group(0)
+            category, name = categories[0]
         context.logger.warning(
             'Group - Multiple category found: <%s>. Use category: <%s> (observations: <%s>)',
-            ','.join([c.name for c, m in categories]),
+            ','.join([c.name for c, n in categories]),
             category.name,
-            config.obs_separator.join(observations)
+            observation
         )
     else:
-        category, cat_match = categories[0]
+        category, name = categories[0]
         if category.outline:
             category = CartographyCategory.OUTLINE
             name = CartographyCategory.OUTLINE.name
-        else:
-            name = cat_match.group(0)
 
     return name.strip().capitalize(), category
 
 
 def match_category_in_observation(pattern: str, value: str) -> re.Match:
-    m = utils.string.match_ignore_case(pattern, value, True)
-    if not m:
-        pattern = '(?!(' + '|'.join(config.mappings.words['proximity']) + ').)* ' + pattern
-        m = utils.string.match_ignore_case(pattern, value, True)
-        if not m:
-            pattern += '.*'
-            m = utils.string.match_ignore_case(pattern, value, True)
-    return m
+    return category_utils.match_category_in_observation(pattern, value)
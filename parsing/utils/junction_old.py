@@ -5,11 +5,14 @@ FIXME deprecated (useless with new way)
 @deprecated
 """
 
+from typing import Dict
+
 import mappings
 import utils
 from model import CartographyGroup, CartographyPoint
+from utils.collection.sequence import IndexedSequence
 from parsing.exception import CartographyParserException
-from . import common, category as category_utils, group as group_utils
+from . import common, group as group_utils
 from ..model import JunctionGroup, ParseContext, PointGroupTuple
 
 
@@ -21,19 +24,20 @@ def determinate_junctions(context: ParseContext):
 
 
 def __determinate_junction(context: ParseContext, ext_point: CartographyPoint, ext_group: CartographyGroup):
-    # Search observation sentence
-    match = None
-    for observation in ext_point.observations:
-        m = utils.string.match_ignore_case(mappings.cartography_junction_pattern, observation, False)
-        if m:
-            match = m
-            break
-    if not match:
+    # Search junction target (found by analysis of observations)
+    target = context.junction_targets.get(ext_point)
+    if not target:
         return
 
     # Determinate point attributes to search
-    partial_name = match.group(2)  # 1: junction word, 2: category (with optional number)
-    category, cat_match = category_utils.parse_point_category(context, partial_name)
+    partial_name, category = target
+    if category is None:
+        raise CartographyParserException(
+            context.row,
+            partial_name,
+            'point category',
+            '|'.join(mappings.cartography_point_category.keys())
+        )
 
     # Search group
     int_group = group_utils.find(context, partial_name, category, context.room)
@@ -57,9 +61,11 @@ def __determinate_junction(context: ParseContext, ext_point: CartographyPoint, e
 
 
 def update_groups_for_junctions(context: ParseContext):
+    # Points of each group changed only by its sequence: the positions of points are kept between junctions
+    sequences: Dict[str, IndexedSequence[CartographyPoint]] = {}
     for junction in context.junctions.values():
         __check_junction(context, junction)
-        __update_groups_for_junction(context, junction)
+        __update_groups_for_junction(context, junction, sequences)
 
 
 def __check_junction(context: ParseContext, junction: JunctionGroup):
@@ -80,34 +86,37 @@ def __check_junction(context: ParseContext, junction: JunctionGroup):
         raise Exception('##TODO## junction group with another of outline')  # TODO
 
 
-def __update_groups_for_junction(context: ParseContext, junction: JunctionGroup):
+def __update_groups_for_junction(
+        context: ParseContext,
+        junction: JunctionGroup,
+        sequences: Dict[str, IndexedSequence[CartographyPoint]]
+):
     # Update groups
     int_group = junction.group
-    int_points = int_group.points
+    int_points = __get_points(sequences, int_group)
     ext_group = junction.start.group
-    ext_points = ext_group.points
+    ext_points = __get_points(sequences, ext_group)  # Changed in place
 
     context.logger.debug('Update groups for junction group <%s>...', int_group.name)
     try:
         # Split external points
-        fst_ext_points: list = utils.collection.list.sublist(ext_points, 0, junction.start.point)
-        mid_ext_points: list = utils.collection.list.sublist(ext_points, junction.start.point,
-                                                             (junction.end.point, 1))
-        lst_ext_points: list = utils.collection.list.sublist(ext_group.points, (junction.end.point, 1))
-
-        # Update external points
-        ext_points.clear()
-        ext_points += fst_ext_points
-
-        ext_to_add_points = [junction.start.point] + int_points + [junction.end.point]
+        start = ext_points.index(junction.start.point)
+        end = ext_points.index(junction.end.point) + 1
+        fst_ext_points = ext_points[:start]
+        mid_ext_points = ext_points[start:end]
+        lst_ext_points = ext_points[end:]
+
+        # Update external points: replace the middle points by the junction points
+        ext_to_add_points = [junction.start.point] + int_points.items + [junction.end.point]
         ext_z = fst_ext_points[-2].location.z if len(fst_ext_points) > 1 \
             else (lst_ext_points[1].location.z if len(lst_ext_points) > 1
                   else None)
         if ext_z is not None and int_points[0].location.z != ext_z:
             ext_to_add_points = [common.normalize_z_axis(p, ext_z) for p in ext_to_add_points]
-        ext_points += ext_to_add_points
-
-        ext_points += lst_ext_points
+        if end < start:  # End point before start point: keep the points between them twice (first + added + last)
+            ext_points.splice(start, start, ext_to_add_points + ext_points[end:start])
+        else:
+            ext_points.splice(start, end, ext_to_add_points)
         context.logger.debug(
             '<%d> points transferred from group <%s> to <%s>',
             len(int_points), int_group.name, ext_group.name
@@ -115,9 +124,17 @@ def __update_groups_for_junction(context: ParseContext, junction: JunctionGroup)
 
         # Update internal points
         mid_ext_points.reverse()  # Reverse for keep order in new group
-        int_points += mid_ext_points
+        int_points.splice(len(int_points), len(int_points), mid_ext_points)
         context.logger.debug(
             '<%d> points transferred from group <%s> to <%s>',
             len(mid_ext_points), ext_group.name, int_group.name)
     except ValueError as err:
         context.logger.error('Failed to update groups for junction group <%s>', int_group.name, exc_info=err)
+
+
+def __get_points(sequences: Dict[str, IndexedSequence[CartographyPoint]], group: CartographyGroup) \
+        -> IndexedSequence[CartographyPoint]:
+    sequence = sequences.get(group.name)
+    if sequence is None:
+        sequence = sequences[group.name] = IndexedSequence(group.points)
+    return sequence
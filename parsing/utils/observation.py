@@ -0,0 +1,115 @@
+"""
+Module for analysis of observations relative to parsing
+"""
+
+import sys
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+import config
+import mappings
+import utils
+from model import CartographyCategory
+from . import category as category_utils, common
+from ..exception import CartographyParserException
+from ..model import ObservationAnalysis, ObservationCategory
+
+# VARIABLES ===================================================================
+__number_suffix = ' ([0-9]+)'
+
+
+# METHODS =====================================================================
+def analyze(observations: List[str], required=False) -> ObservationAnalysis:
+    """
+    Analyze the observations of a file point: categories (with numbers), then for the observation of each category:
+    categories, interest type (with count) and junction target.<br />
+    NB: the analysis of each observation is kept in cache (see cache_info) by normalized observation (see normalize,
+    case ignored), for the active version of mappings.
+
+    :param observations Observations to analyze
+    :param required If an exception must be thrown if not category found
+    :return Analysis of observations
+    """
+    analysis = ObservationAnalysis(observations)
+
+    # By category then by observation
+    found = []
+    for observation in observations:
+        text = normalize(observation)
+        key = text.lower()
+        if len(key) != len(text):  # Spans of cached analysis are used in text (ex: "İ" is lower cased in 2 chars)
+            key = text
+        found += [(item[0], __create_category(text, item)) for item in __analyze_observation(key, mappings.words_version)]
+    found.sort(key=lambda f: f[0])
+    analysis.categories = [item for index, item in found]
+
+    if not analysis.categories and required:
+        raise CartographyParserException(
+            -1,
+            config.obs_separator.join(observations),
+            'point categories',
+            '|'.join(mappings.cartography_point_category.keys())
+        )
+    return analysis
+
+
+def normalize(observation: str) -> str:
+    """Normalize the whitespaces of an observation (without space at start/end, only one space between words)"""
+    normalized = ' '.join(observation.split())
+    return observation if normalized == observation else normalized  # Same instance if normalized (interned)
+
+
+def cache_info() -> Any:
+    """Statistics of cache of analysis: hits, misses, maxsize and currsize"""
+    return __analyze_observation.cache_info()
+
+
+def clear_cache():
+    __analyze_observation.cache_clear()
+
+
+# METHODS - INTERNAL ==========================================================
+@lru_cache(maxsize=config.obs_cache_size)
+def __analyze_observation(observation: str, words_version: Any) -> Tuple[tuple, ...]:
+    # NB: version of words in key for never use an analysis done with old mappings.
+    # Only immutable values in cache: index of category, category, end of its observation, proximity, number,
+    # categories in observation (with span), interest and junction target (span of name, category)
+    matcher = category_utils.get_matcher()
+    hits = mappings.cartography_keywords.search(observation)  # Only one scan of keywords by observation
+    items = []
+    for index, m in matcher.match_part(observation, hits):
+        pattern, category = matcher.categories[index]
+        number = int(m.group(m.re.groups)) if pattern.endswith(__number_suffix) else None
+
+        # The observation of category is at start of observation: its keywords are the keywords found before its end
+        item_observation = m.group(0)
+        item_hits = [h for h in hits if h[1] <= m.end()]
+        categories = tuple(
+            (matcher.categories[i][1], im.span()) for i, im in matcher.match_part(item_observation, item_hits)
+        )
+        interest = common.check_interest(item_observation, None, item_hits)
+        junction = __analyze_junction(item_observation)
+        items.append((index, category, m.end(), matcher.is_proximity(m), number, categories, interest, junction))
+    return tuple(items)
+
+
+def __analyze_junction(observation: str) -> Optional[Tuple[Tuple[int, int], CartographyCategory]]:
+    m = utils.string.match_ignore_case(mappings.cartography_junction_pattern, observation, False)
+    if not m:
+        return None
+
+    partial_name = m.group(2)  # 1: junction word, 2: category (with optional number)
+    categories = category_utils.parse_categories(partial_name)
+    return m.span(2), categories[0][0] if categories else None
+
+
+def __create_category(text: str, analysis: tuple) -> ObservationCategory:
+    # New item for each point (the cached analysis is shared), with the texts of observation (not lower cased).
+    # NB: observation of item interned as the observations read (kept by each point)
+    index, category, end, proximity, number, categories, interest, junction = analysis
+    item = ObservationCategory(category, sys.intern(text[:end]), proximity)
+    item.number = number
+    item.categories = [(c, text[c_start:c_end]) for c, (c_start, c_end) in categories]
+    item.interest = interest
+    item.junction = (text[junction[0][0]:junction[0][1]], junction[1]) if junction else None
+    return item
@@ -0,0 +1,127 @@
+"""
+Module for columnar representation of cartography files (NumPy)
+"""
+
+import os
+from typing import Dict, List, Optional
+
+import numpy
+
+import utils
+from utils.math import Vector
+from .model import CartographyFile, CartographyFileInfo, CartographyFileLine, CartographyFilePoint, \
+    CartographyFileSide
+
+
+# CLASSES =====================================================================
+class CartographyColumnarFile:
+    """
+    Cartography file with points stored by column in typed arrays.<br />
+    NB: point names and observations are interned in a shared table and the raw text of point lines isn't kept.
+    """
+
+    # Constructor -------------------------------------------------------------
+    def __init__(self, filepath: os.path, count: int = 0):
+        self.path = filepath
+        self.headers: List[CartographyFileLine] = []
+        self.info: Optional[CartographyFileInfo] = None
+
+        # Shared table of strings (point names and observations)
+        self.strings: List[str] = []
+
+        # Points
+        self.rows = numpy.zeros(count, numpy.int32)
+        self.name_indexes = numpy.zeros(count, numpy.int32)
+        self.sides = numpy.zeros(count, numpy.uint8)  # Value of CartographyFileSide (0 if no side)
+        self.s1_distances = numpy.zeros(count, numpy.int32)
+        self.s2_distances = numpy.zeros(count, numpy.int32)
+        self.heights = numpy.zeros(count, numpy.int32)
+        self.locations = numpy.zeros((count, 3), numpy.float64)  # x, y, z
+
+        # Observations of point i: strings[observation_indexes[observation_offsets[i]:observation_offsets[i + 1]]]
+        self.observation_offsets = numpy.zeros(count + 1, numpy.int32)
+        self.observation_indexes = numpy.zeros(0, numpy.int32)
+
+    # Methods -----------------------------------------------------------------
+    # Conversion
+    @staticmethod
+    def from_file(file: CartographyFile) -> 'CartographyColumnarFile':
+        count = len(file.points)
+        columnar = CartographyColumnarFile(file.path, count)
+        columnar.headers = list(file.headers)
+        columnar.info = file.info
+
+        string_indexes: Dict[str, int] = {}
+
+        def intern(value: str) -> int:
+            index = string_indexes.get(value)
+            if index is None:
+                index = len(columnar.strings)
+                string_indexes[value] = index
+                columnar.strings.append(value)
+            return index
+
+        observation_indexes = []
+        for i, point in enumerate(file.points):
+            columnar.rows[i] = point.row
+            columnar.name_indexes[i] = intern(point.point_name)
+            columnar.sides[i] = point.side.value if point.side else 0
+            columnar.s1_distances[i] = point.s1_distance
+            columnar.s2_distances[i] = point.s2_distance
+            columnar.heights[i] = point.height
+            columnar.locations[i] = tuple(point.location)
+
+            observation_indexes += [intern(o) for o in point.observations]
+            columnar.observation_offsets[i + 1] = len(observation_indexes)
+        columnar.observation_indexes = numpy.array(observation_indexes, numpy.int32)
+
+        return columnar
+
+    def to_file(self) -> CartographyFile:
+        file = CartographyFile(self.path)
+        file.headers = list(self.headers)
+        file.info = self.info
+        file.points = [self.get_point(i) for i in range(len(self))]
+        return file
+
+    # Points
+    def get_point(self, index: int) -> CartographyFilePoint:
+        side = int(self.sides[index])
+        return CartographyFilePoint(
+            int(self.rows[index]),
+            '',
+            location=Vector(self.locations[index].tolist()),
+            observations=self.get_observations(index),
+            point_name=self.strings[self.name_indexes[index]],
+            side=CartographyFileSide(side) if side else None,
+            s1_distance=int(self.s1_distances[index]),
+            s2_distance=int(self.s2_distances[index]),
+            height=int(self.heights[index])
+        )
+
+    def get_observations(self, index: int) -> List[str]:
+        start, end = self.observation_offsets[index:index + 2]
+        return [self.strings[i] for i in self.observation_indexes[start:end]]
+
+    def calculate_coordinates(self):
+        """Calculate the coordinates of all points from distances to S1/S2 and heights"""
+        self.locations = utils.math.calc_coordinates_by_dist_batch(
+            self.s1_distances,
+            self.s2_distances,
+            self.heights,
+            self.info.s1s2_distance,
+            self.has_side(CartographyFileSide.LEFT)
+        )
+
+    def has_side(self, side: CartographyFileSide) -> numpy.ndarray:
+        """Mask of points with the given side"""
+        return self.sides == side.value
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __repr__(self):
+        return utils.object.to_repr(self)
+
+    def __str__(self):
+        return utils.object.to_str(self)
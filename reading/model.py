@@ -7,9 +7,8 @@ from enum import Enum
 from logging import Logger
 from typing import List, Optional
 
-from mathutils import Vector
-
 import utils
+from utils.math import Vector
 
 
 # CLASSES =====================================================================
@@ -33,6 +32,7 @@ class CartographyFile:
 
 class CartographyFileLine:
     """Line in cartography file"""
+    __slots__ = ('row', 'text')
 
     # Constructor -------------------------------------------------------------
     def __init__(self, row: int, text: str):
@@ -49,6 +49,7 @@ class CartographyFileLine:
 
 class CartographyFileInfo(CartographyFileLine):
     """Cartography file info"""
+    __slots__ = ('scribes1', 'scribes2', 'explorers', 's1s2_distance')
 
     # Constructor -------------------------------------------------------------
     def __init__(self, row: int, text: str):
@@ -75,13 +76,14 @@ class CartographyFileSide(Enum):
 
 class CartographyFilePoint(CartographyFileLine):
     """Point line in cartography file"""
+    __slots__ = ('location', 'observations', 'point_name', 'side', 's1_distance', 's2_distance', 'height')
 
     # Constructor -------------------------------------------------------------
     def __init__(
             self,
             row: int,
             text: str,
-            location: Vector = Vector((0, 0, 0)),
+            location: Optional[Vector] = None,
             observations: List[str] = None,
             point_name: str = '',
             side: CartographyFileSide = None,
@@ -90,7 +92,7 @@ class CartographyFilePoint(CartographyFileLine):
             height: int = 0,
     ):
         CartographyFileLine.__init__(self, row, text)
-        self.location = location
+        self.location = location if location is not None else Vector((0, 0, 0))
         self.observations = observations or []
         self.point_name = point_name
         self.side = side
@@ -107,10 +109,15 @@ class CartographyFilePoint(CartographyFileLine):
 
 
 class ReadContext:
-    """Context for CartographyReader"""
+    """Context for CartographyReader (state of one reading)"""
 
     def __init__(self, separator: str, logger: Logger):
         self.separator = separator
         self.row: int = 1
         self.column: int = 1
         self.logger: Logger = logger
+
+        # State of reading
+        self.header: bool = True  # If the point table isn't reached
+        self.header_info: int = -1  # Line of header information: -1 before, 0 next line, 1 read, 99 invalid
+        self.last_point_side: Optional[CartographyFileSide] = None
@@ -4,8 +4,9 @@ Module for commons reader classes
 
 import os
 from abc import abstractmethod
+from typing import Iterator
 
-from ..model import CartographyFile
+from ..model import CartographyFile, CartographyFileLine, CartographyFilePoint
 
 
 # CLASSES =====================================================================
@@ -16,3 +17,13 @@ class CartographyReader:
     @abstractmethod
     def read(self, filepath: os.path) -> CartographyFile:
         pass
+
+    @abstractmethod
+    def iter_lines(self, filepath: os.path) -> Iterator[CartographyFileLine]:
+        """Read lazily the lines (headers, info and points) of a file"""
+        pass
+
+    @abstractmethod
+    def iter_points(self, filepath: os.path) -> Iterator[CartographyFilePoint]:
+        """Read lazily the points of a file"""
+        pass
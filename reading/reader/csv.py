@@ -4,12 +4,12 @@ Module for CSV reader
 
 import logging
 import os
-from typing import Optional
-
-from mathutils import Vector
+import sys
+from typing import Iterator, Optional
 
 import config
 import utils
+from utils.math import Vector
 from .common import CartographyReader
 from .. import utils as read_utils
 from ..exception import CartographyReaderException
@@ -24,63 +24,98 @@ class CartographyCsvReader(CartographyReader):
     # Fields ------------------------------------------------------------------
     __logger: logging.Logger = logging.getLogger('CartographyCsvReader')
 
+    # Point line: pattern and group name of each column
+    __point_patterns = (
+        'point [0-9]+',  # Point name (0)
+        '[DGRL]?',  # Side (1)
+        '([0-9]+)?',  # Distance to S1 (2)
+        '([0-9]+)?',  # Distance to S2 (3)
+        '-?([0-9]+)?',  # Height (4)
+        '([A-Za-z0-9].+)', '',  # Observations (5)
+        '(-?[0-9]+)?', '-?[0-9]+',  # calc + X (8)
+        '(-?[0-9]+)?', '-?[0-9]+',  # calc + Y (10)
+        '', '-?[0-9]+',  # Z (12)
+        '', '', '', '', '(.+)?'  # Adjacent Y (17)
+    )
+    __point_names = (
+        'name',
+        'side',
+        's1_distance',
+        's2_distance',
+        'height',
+        'observations', None,
+        None, 'x',
+        None, 'y',
+        None, 'z',
+        None, None, None, None, 'adjacent_y'
+    )
+
     # Constructor -------------------------------------------------------------
     def __init__(self, separator: str, logger: Optional[logging.Logger] = None):
-        self.__context = ReadContext(separator, logger or self.__logger)
-        self.__file: Optional[CartographyFile] = None
-        self.__header: bool = True
-        self.__header_info: int = -1
-        self.__last_point_side = None
+        # NB: the state of each reading is kept in its own context (a reader can be used by many threads)
+        self.__separator = separator
+        self.__context_logger = logger or self.__logger
 
     # Methods -----------------------------------------------------------------
     # Reading
     def read(self, filepath: os.path) -> CartographyFile:
-        self.__file = CartographyFile(filepath)
-        self.__header = True
-        self.__header_info = -1
-        self.__context.row = 0
-        self.__context.column = 0
+        file = CartographyFile(filepath)
+        for line in self.iter_lines(filepath):
+            if isinstance(line, CartographyFilePoint):
+                file.points.append(line)
+            else:
+                if isinstance(line, CartographyFileInfo):
+                    file.info = line
+                file.headers.append(line)
+        return file
+
+    def iter_points(self, filepath: os.path) -> Iterator[CartographyFilePoint]:
+        return (line for line in self.iter_lines(filepath) if isinstance(line, CartographyFilePoint))
+
+    def iter_lines(self, filepath: os.path) -> Iterator[CartographyFileLine]:
+        context = ReadContext(self.__separator, self.__context_logger)
+        context.row = 0
+        context.column = 0
 
         with open(filepath, 'r', encoding='utf8') as file:
             # Read all lines in CSV file
             for line in file:
-                self.__context.row += 1
+                context.row += 1
                 line = line.strip()
                 if not line:
                     continue
                 elif line.startswith('#'):
-                    read_utils.line.ignore(self.__context, line)
+                    read_utils.line.ignore(context, line)
                     continue
-                elif self.__header:
-                    read = False
-                    if self.__header_info == 0:
-                        read = self.__read_header_info(line)
+                elif context.header:
+                    read = None
+                    if context.header_info == 0:
+                        read = self.__read_header_info(context, line)
 
-                    if not read:
-                        self.__read_header(line)
+                    yield read or self.__read_header(context, line)
                 else:
-                    self.__read_point(line)
+                    point = self.__read_point(context, line)
+                    if point:
+                        yield point
 
             # Check if a point found
-            if self.__header:
+            if context.header:
                 raise CartographyReaderException(
-                    self.__context.row,
-                    self.__context.column,
+                    context.row,
+                    context.column,
                     'Only header was found!',
                     'header',
                     'A line of type "point"'
                 )
 
-        return self.__file
-
-    def __read_header(self, line: str):
-        self.__file.headers.append(CartographyFileLine(self.__context.row, line))
-        if self.__header_info < 0 and read_utils.line.check(self.__context, line, 'header', [
+    def __read_header(self, context: ReadContext, line: str) -> CartographyFileLine:
+        header = CartographyFileLine(context.row, line)
+        if context.header_info < 0 and read_utils.line.check(context, line, 'header', [
             'position, de 2', '', 'scribe 1', 'scribe 2', '', 'explorateur'
         ], False):
-            self.__logger.debug('Header of information found: <%d>', self.__context.row)
-            self.__header_info = 0
-        elif read_utils.line.check(self.__context, line, 'header', [
+            self.__logger.debug('Header of information found: <%d>', context.row)
+            context.header_info = 0
+        elif read_utils.line.check(context, line, 'header', [
             'point :',
             '(côté|cote|side) : [GL]/[DR]',
             'Distance (à|to) S1',
@@ -92,10 +127,11 @@ class CartographyCsvReader(CartographyReader):
             'Z', '', '', '', '',
             'Adjacent \\(Y\\)'
         ], False):
-            self.__logger.debug('Header of point table found: <%d>', self.__context.row)
-            self.__header = False
+            self.__logger.debug('Header of point table found: <%d>', context.row)
+            context.header = False
+        return header
 
-    def __read_header_info(self, line: str) -> bool:
+    def __read_header_info(self, context: ReadContext, line: str) -> Optional[CartographyFileInfo]:
         # Check line describe the info from header
         patterns = [
             'distance 1-2',  # Distance S1-S2 label
@@ -105,105 +141,92 @@ class CartographyCsvReader(CartographyReader):
             '(.+)', '', '',  # Explorer
             'méthode des cercles'  # Coordinates label
         ]
-        matches = read_utils.line.check(self.__context, line, 'header', patterns, False)
+        matches = read_utils.line.check(context, line, 'header', patterns, False)
         if not matches:
-            self.__logger.warning('Header information line <%d> not match with excepted pattern', self.__context.row)
+            self.__logger.warning('Header information line <%d> not match with excepted pattern', context.row)
             self.__logger.debug(
                 'Header information line <%d> not match with expected pattern:\n\tpattern=<%s>\n\tline=<%s>',
-                self.__context.row,
-                utils.io.file.format_line_for_logging(self.__context.separator.join(patterns)),
+                context.row,
+                utils.io.file.format_line_for_logging(context.separator.join(patterns)),
                 utils.io.file.format_line_for_logging(line)
             )
-            self.__header_info = 99
-            return False
+            context.header_info = 99
+            return None
 
-        self.__logger.debug('Header information line found: <%d>', self.__context.row)
-        info = CartographyFileInfo(self.__context.row, line)
+        self.__logger.debug('Header information line found: <%d>', context.row)
+        info = CartographyFileInfo(context.row, line)
         info.s1s2_distance = int(matches[1].group(0))
         info.scribes1 = matches[2].group(0).split(', ?')
         info.scribes2 = matches[3].group(0).split(', ?')
         info.explorers = matches[5].group(0).split(', ?')
-        self.__file.info = info
-        self.__file.headers.append(info)
 
-        self.__header_info = 1
-        return True
+        context.header_info = 1
+        return info
 
-    def __read_point(self, line: str):
+    def __read_point(self, context: ReadContext, line: str) -> Optional[CartographyFilePoint]:
         # Check line describe a point
-        patterns = [
-            'point [0-9]+',  # Point name (0)
-            '[DGRL]?',  # Side (1)
-            '([0-9]+)?',  # Distance to S1 (2)
-            '([0-9]+)?',  # Distance to S2 (3)
-            '-?([0-9]+)?',  # Height (4)
-            '([A-Za-z0-9].+)', '',  # Observations (5)
-            '(-?[0-9]+)?', '-?[0-9]+',  # calc + X (8)
-            '(-?[0-9]+)?', '-?[0-9]+',  # calc + Y (10)
-            '', '-?[0-9]+',  # Z (12)
-            '', '', '', '', '(.+)?'  # Adjacent Y (17)
-        ]
-        matches = read_utils.line.check(self.__context, line, 'point', patterns, False)
-        if not matches:
-            matches = read_utils.line.check(self.__context, line, 'point', ['point [0-9]+'], False, True)
+        m = read_utils.line.match(context, line, self.__point_patterns, self.__point_names)
+        if not m:
+            # Check cell by cell for error reporting (and lines to ignore)
+            read_utils.line.check(context, line, 'point', list(self.__point_patterns), False)
+            matches = read_utils.line.check(context, line, 'point', ['point [0-9]+'], False, True)
             if not matches:
                 raise CartographyReaderException(
-                    self.__context.row,
-                    self.__context.column,
+                    context.row,
+                    context.column,
                     line,
                     'point',
-                    self.__context.separator.join(patterns)
+                    context.separator.join(self.__point_patterns)
                 )
-            read_utils.line.ignore(self.__context, line)
-            return
+            read_utils.line.ignore(context, line)
+            return None
 
         # Create a new point
-        self.__logger.debug('Point line found: #%d', self.__context.row)
-        point = CartographyFilePoint(self.__context.row, line)
+        self.__logger.debug('Point line found: #%d', context.row)
+        point = CartographyFilePoint(context.row, line)
 
         # Determine string information
-        point.point_name = matches[0].group(0)
-        point.s1_distance = int(matches[2].group(0)) if matches[2].group(0) else 0
-        point.s2_distance = int(matches[3].group(0)) if matches[3].group(0) else 0
-        point.height = int(matches[4].group(0)) if matches[4].group(0) else 0
+        point.point_name = sys.intern(m.group('name'))  # Same names in many files/rooms
+        point.s1_distance = int(m.group('s1_distance')) if m.group('s1_distance') else 0
+        point.s2_distance = int(m.group('s2_distance')) if m.group('s2_distance') else 0
+        point.height = int(m.group('height')) if m.group('height') else 0
 
         # Determine coordinates
         point.location = Vector((
-            int(matches[8].group(0)),
-            int(matches[10].group(0)),
-            int(matches[12].group(0))
+            int(m.group('x')),
+            int(m.group('y')),
+            int(m.group('z'))
         ))
 
         # Determine point side
-        side = matches[1].group(0)
+        side = m.group('side')
         if not side:
-            if not self.__last_point_side:
+            if not context.last_point_side:
                 self.__logger.warning('No point side found. The side is unknown')
                 point.side = CartographyFileSide.UNKNOWN
             else:
-                self.__logger.warning('No point side found. Use the last side used: <%s>', self.__last_point_side)
-                point.side = self.__last_point_side
+                self.__logger.warning('No point side found. Use the last side used: <%s>', context.last_point_side)
+                point.side = context.last_point_side
         elif utils.string.match_ignore_case('[GL]', side):
             point.side = CartographyFileSide.LEFT
         elif utils.string.match_ignore_case('[DR]', side):
             point.side = CartographyFileSide.RIGHT
 
         if not point.side:
-            raise CartographyReaderException(self, side, 'point side', '[DGRL]')
-        self.__last_point_side = point.side
+            raise CartographyReaderException(context.row, context.column, side, 'point side', '[DGRL]')
+        context.last_point_side = point.side
 
         # Determine observations
-        observations = matches[5].group(0)
+        observations = m.group('observations')
         if not observations and not observations.strip():
             raise CartographyReaderException(
-                self.__context.row,
-                self.__context.column,
+                context.row,
+                context.column,
                 '',
                 'point observations',
                 'not_blank'
             )
-        point.observations = [o.strip() for o in observations.split(config.obs_separator)]
+        point.observations = [sys.intern(o.strip()) for o in observations.split(config.obs_separator)]
 
-        # Add line to file
-        self.__logger.debug('Add point line to file: %s', str(point))
-        self.__file.points.append(point)
+        self.__logger.debug('Point line read: %s', point)
+        return point
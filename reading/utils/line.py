@@ -3,12 +3,18 @@ Module for treat lines
 """
 
 import re
+from functools import lru_cache
+from typing import Optional, Tuple
 
 import utils
 from ..exception import CartographyReaderException
 from ..model import ReadContext
 
 
+# VARIABLES ===================================================================
+__optional_pattern = re.compile('\\(.+\\)\\?')
+
+
 # METHODS =====================================================================
 def check(context: ReadContext, line: str, line_type: str, patterns: list, strict=True, ignore_reduced=False):
     matches = []
@@ -19,9 +25,7 @@ def check(context: ReadContext, line: str, line_type: str, patterns: list, stric
 
     # Determine columns count
     patterns_count = len(patterns)
-    columns = patterns_count
-    while columns > 0 and (not patterns[columns - 1] or re.match('\\(.+\\)\\?', patterns[columns - 1])):
-        columns -= 1
+    columns = count_required_columns(tuple(patterns))
     count = min(max(data_count, columns), patterns_count)
 
     # Check number of columns
@@ -62,5 +66,95 @@ def check(context: ReadContext, line: str, line_type: str, patterns: list, stric
     return matches
 
 
+def match(context: ReadContext, line: str, patterns: Tuple[str, ...], names: Tuple[Optional[str], ...],
+          ignore_reduced=False) -> Optional[re.Match]:
+    """
+    Check and extract all columns of a line in one pass (same rules as check with strict=False).
+
+    :param context Read context
+    :param line Line to check
+    :param patterns Pattern of each column
+    :param names Name of group for each column (None for a column not extracted)
+    :param ignore_reduced If no warning must be logged when the line has more columns than patterns
+    :return Match of the line (with a group by column name), None if the line not match with patterns
+    """
+    m = compile_line(context.separator, patterns, names).match(line)
+    if m is not None and m.group('extra') is not None and not ignore_reduced:
+        count = len(patterns)
+        data_count = line.count(context.separator) + 1
+        context.logger.warning('Data ignored for line <%d>: <%d> column(s) ignored', context.row, data_count - count)
+        context.logger.debug(
+            'Data ignored for line <%d> (case insensitive):'
+            '\n\tpattern: [count: <%d>, data: <%s>]'
+            '\n\tline: [count: <%d>, data: <%s>]',
+            context.row,
+            count, utils.io.file.format_line_for_logging(context.separator.join(patterns)),
+            data_count, utils.io.file.format_line_for_logging(line)
+        )
+    return m
+
+
+@lru_cache(maxsize=64)
+def compile_line(separator: str, patterns: Tuple[str, ...], names: Tuple[Optional[str], ...]) -> re.Pattern:
+    """
+    Compile an anchored regex matching a full line, where each column must start by its pattern.<br />
+    NB: trailing empty or optional columns can be missing and the columns after the patterns are ignored.
+    """
+    sep = re.escape(separator)
+    cells = [__compile_cell(separator, pattern, name) for pattern, name in zip(patterns, names)]
+    columns = count_required_columns(patterns)
+
+    # Build from the end: each optional column wraps the following ones
+    regex = '(?P<extra>' + sep + '.*)?'
+    for cell in reversed(cells[columns:]):
+        regex = '(?:' + sep + cell + regex + ')?'
+    regex = sep.join(cells[:columns]) + regex
+    return re.compile('^' + regex + '$', re.IGNORECASE)
+
+
+@lru_cache(maxsize=64)
+def count_required_columns(patterns: Tuple[str, ...]) -> int:
+    """Count the columns required by patterns (the trailing empty or optional patterns are not required)"""
+    columns = len(patterns)
+    while columns > 0 and (not patterns[columns - 1] or __optional_pattern.match(patterns[columns - 1])):
+        columns -= 1
+    return columns
+
+
+def __compile_cell(separator: str, pattern: str, name: Optional[str]) -> str:
+    if not pattern:
+        return ''  # Empty column
+    cell = __bound_to_cell(separator, pattern)
+    other = '[^' + re.escape(separator) + ']*'  # Rest of column ignored, like re.match on the column value
+    return ('(?P<' + name + '>' + cell + ')' if name else '(?:' + cell + ')') + other
+
+
+def __bound_to_cell(separator: str, pattern: str) -> str:
+    """Forbid the separator where the pattern matches any character (dot and negated sets)"""
+    sep = re.escape(separator)
+    bounded = ''
+    in_set = False
+    negated_set = False
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if c == '\\':
+            bounded += pattern[i:i + 2]
+            i += 2
+            continue
+        if in_set:
+            in_set = c != ']' or bounded.endswith('[') or bounded.endswith('[^')
+            if not in_set and negated_set:
+                bounded += sep
+        elif c == '[':
+            in_set = True
+            negated_set = pattern.startswith('^', i + 1)
+        elif c == '.':
+            c = '[^' + sep + ']'
+        bounded += c
+        i += 1
+    return bounded
+
+
 def ignore(context: ReadContext, line: str):
     context.logger.info('Ignore <%s> (l.%d)', utils.io.file.format_line_for_logging(line), context.row)
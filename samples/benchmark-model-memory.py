@@ -0,0 +1,82 @@
+"""
+Measure the memory used by the models of read and parsed files (without Blender): bytes by point.<br />
+With --no-slots, the model classes are replaced by copies without __slots__ (as before the slots) for compare.
+"""
+
+import gc
+import glob
+import logging
+import platform
+import sys
+import tracemalloc
+import types
+
+print('Python version  : ' + platform.python_version())
+
+folder = '.'
+if folder not in sys.path:
+    sys.path.append(folder)
+
+from model.cartography import structure  # noqa: E402
+from reading import model as reading_model  # noqa: E402
+
+
+def without_slots(classes):
+    """Copies of classes without __slots__ (base classes first), by identity of original class"""
+    copies = {}
+    for cls in classes:
+        bases = tuple(copies.get(id(b), b) for b in cls.__bases__)
+        members = {
+            k: v for k, v in vars(cls).items()
+            if k not in ('__slots__', '__dict__', '__weakref__') and not isinstance(v, types.MemberDescriptorType)
+        }
+        copies[id(cls)] = type(cls)(cls.__name__, bases, members)
+    return copies
+
+
+def replace_classes(copies):
+    """Replace the classes in all modules already imported (the next imports use the modules already patched)"""
+    for module in list(sys.modules.values()):
+        for name, value in list(vars(module).items()):
+            if id(value) in copies and isinstance(value, type):
+                setattr(module, name, copies[id(value)])
+
+
+slots = '--no-slots' not in sys.argv
+if not slots:
+    replace_classes(without_slots([
+        structure.CartographyPoint, structure.CartographyGroup, structure.CartographyJunction,
+        reading_model.CartographyFileLine, reading_model.CartographyFileInfo, reading_model.CartographyFilePoint
+    ]))
+print('Slots           : {}'.format(slots))
+
+from parsing import pool  # noqa: E402
+
+logging.disable(logging.CRITICAL)
+
+# Files given in arguments (samples by default), each file is parsed many times for a large map
+filepaths = [a for a in sys.argv[1:] if a != '--no-slots'] or sorted(glob.glob('samples/files/*.tsv'))
+repeat = 20
+
+pool.read_and_parse(filepaths[0])  # Load modules and caches before measure
+gc.collect()
+tracemalloc.start()
+start, _ = tracemalloc.get_traced_memory()
+
+rooms = []
+for i in range(repeat):
+    for filepath in filepaths:
+        room, error = pool.read_and_parse(filepath)
+        if room:
+            rooms.append(room)
+
+gc.collect()
+end, peak = tracemalloc.get_traced_memory()
+tracemalloc.stop()
+
+points = sum(len(room.all_points) for room in rooms)
+print('Rooms           : {}'.format(len(rooms)))
+print('Points          : {}'.format(points))
+print('Memory          : {} bytes ({} bytes by point, peak: {} bytes)'.format(
+    end - start, (end - start) // max(points, 1), peak - start
+))
@@ -0,0 +1,27 @@
+"""
+Launch an action of the addon without Blender (only actions without bpy: calculate_coordinates)
+"""
+
+import logging.config
+import os
+import platform
+import sys
+
+print('Python version  : ' + platform.python_version())
+print('Script arguments: ' + ' '.join(arg for i, arg in enumerate(sys.argv) if '--' in sys.argv[:i]))
+
+folder = '.'
+if folder not in sys.path:
+    sys.path.append(folder)
+
+import main  # noqa: E402
+import utils  # noqa: E402
+
+# Logging
+logging.config.fileConfig(
+    fname=os.path.join(utils.io.path.workspace(), 'logging.conf'),
+    disable_existing_loggers=False
+)
+
+# Direct launch mode
+main.entry_point(main.args.action)
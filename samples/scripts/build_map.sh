@@ -0,0 +1,16 @@
+#!/bin/bash
+
+if [ $# -eq 0 ]; then
+  echo "A parameter is required: directory or glob pattern of files"
+  exit 1
+fi
+
+action="build_map";
+batch=$1;
+output=${2:-samples/generated};  # Directory (a .blend by room)
+jobs=${3:-4};  # Number of Blender workers
+
+echo "Launch python script (Blender workers are started by the script)"
+echo "Parameters: action=$action, batch=$batch, output=$output, jobs=$jobs"
+python3 samples/cartography-addon-exec.py --\
+  -a "$action" -b "$batch" -o "$output" -j "$jobs"
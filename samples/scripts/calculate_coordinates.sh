@@ -11,8 +11,8 @@ output=${file/%.tsv/-alt.tsv};
 output=${output/%.csv/-alt.csv};
 output=${output/files/generated};
 
-echo "Launch python script in blender"
+echo "Launch python script (without blender)"
 echo "Parameters: action=$action, file=$file, output=$output"
-blender --background --python samples/blender-cartography-addon-exec.py --\
+python3 samples/cartography-addon-exec.py --\
   -a "$action" -f "$file" -o "$output"
 
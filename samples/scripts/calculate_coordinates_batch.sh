@@ -0,0 +1,15 @@
+#!/bin/bash
+
+if [ $# -eq 0 ]; then
+  echo "A parameter is required: directory or glob pattern of files"
+  exit 1
+fi
+
+action="calculate_coordinates";
+batch=$1;
+output=${2:-samples/generated};
+
+echo "Launch python script (without blender)"
+echo "Parameters: action=$action, batch=$batch, output=$output"
+python3 samples/cartography-addon-exec.py --\
+  -a "$action" -b "$batch" -o "$output"
@@ -0,0 +1,15 @@
+#!/bin/bash
+
+if [ $# -eq 0 ]; then
+  echo "A parameter is required: directory or glob pattern of files"
+  exit 1
+fi
+
+action="generate_blender_file";
+batch=$1;
+output=${2:-samples/generated};  # Directory (a .blend by room) or .blend file (combined map)
+
+echo "Launch python script in blender"
+echo "Parameters: action=$action, batch=$batch, output=$output"
+blender --background --python samples/blender-cartography-addon-exec.py --\
+  -a "$action" -b "$batch" -o "$output"
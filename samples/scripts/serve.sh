@@ -0,0 +1,10 @@
+#!/bin/bash
+
+action="serve";
+port=${1:-5566};
+
+echo "Launch python script in blender"
+echo "Parameters: action=$action, port=$port"
+echo "Send jobs with: echo \"{\\\"token\\\": \\\"\$(cat bca-serve.token)\\\", \\\"action\\\": \\\"generate_blender_file\\\", \\\"file\\\": \\\"room.tsv\\\"}\" | nc -q 5 localhost $port"
+blender --background --python samples/blender-cartography-addon-exec.py --\
+  -a "$action" -p "$port"
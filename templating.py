@@ -22,6 +22,7 @@ class CartographyTemplate:
     def __init__(self, filepath: os.path):
         self.filepath = filepath
         self.objects = {}
+        self.loaded_objects = []  # All objects loaded from file (removed by unload)
 
 
 class CartographyTemplateReader:
@@ -36,10 +37,26 @@ class CartographyTemplateReader:
             data_to.objects = self.__filter_already_exists(data_from.objects, bpy.data.objects)  # import materials too
 
         template = CartographyTemplate(filepath)
+        template.loaded_objects = [obj for obj in data_to.objects if obj is not None]
         for obj_type, obj_name in mappings.cartography_object_type.items():
             template.objects[obj_type] = self.__find_object_by_name(obj_name) if obj_name is not None else None
         return template
 
+    def unload(self, template: CartographyTemplate):
+        """Remove the objects loaded by the reading of a template, with their orphan meshes and materials"""
+        for obj in template.loaded_objects:
+            data = obj.data
+            materials = [m for m in data.materials if m] if isinstance(data, bpy.types.Mesh) else []
+            bpy.data.objects.remove(obj)
+            if isinstance(data, bpy.types.Mesh) and data.users == 0:
+                bpy.data.meshes.remove(data)
+            for material in materials:
+                if material.users == 0:
+                    bpy.data.materials.remove(material)
+        self.__logger.debug('<%d> objects of template <%s> removed', len(template.loaded_objects), template.filepath)
+        template.loaded_objects = []
+        template.objects = {}
+
     @staticmethod
     def __filter_already_exists(source, target):
         return [item for item in source if item not in target]
@@ -1 +1,8 @@
-from . import args, blender, collection, io, math, object, string
+from . import args, automaton, collection, common, io, math, object, string, vector
+
+try:
+    from . import blender
+except ModuleNotFoundError as err:  # Outside Blender (bpy, bmesh and mathutils unavailable)
+    if err.name not in common.blender_modules:
+        raise
+    blender = None
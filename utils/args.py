@@ -15,8 +15,12 @@ def add(name_or_flags: str, action: str, _type: any, _help: str):
     __arg_parser.add_argument(name_or_flags, action, type=_type, help=_help)
 
 
+def add_flag(name_or_flags: str, action: str, _help: str):
+    __arg_parser.add_argument(name_or_flags, action, action='store_true', help=_help)
+
+
 def get() -> List[str]:
-    index = sys.argv.index('--')
+    index = sys.argv.index('--') if '--' in sys.argv else -1
     return sys.argv[index + 1:] if index > 0 else sys.argv
 
 
@@ -0,0 +1,176 @@
+"""
+Module for keyword automaton (Aho-Corasick) over folded text (lower case and without accents)
+"""
+
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+# VARIABLES ===================================================================
+__specials = '.*+{}^$\\'  # Characters of regular expression never expanded (regex fallback)
+
+
+# CLASSES =====================================================================
+class KeywordAutomaton:
+    """
+    Automaton for find all keywords of many keys in a text with only one scan.<br />
+    Keywords are added as simple regular expressions (literals, [abc], x?, (a|b) and (a)?) expanded in literals.
+    The keys of a pattern not expandable are kept in fallback keys: they must be always verified.<br />
+    NB: the text and keywords are folded (see fold), so a keyword found is only a candidate (the regular expression of
+    keyword must be used for verify). The automaton must be built after the last keyword added (see build), then it
+    is only read by search (usable by many threads).
+    """
+
+    # Constructor -------------------------------------------------------------
+    def __init__(self, limit: int = 256):
+        self.limit = limit  # Max count of literals by pattern
+        self.keys: Set[Any] = set()  # All keys added
+        self.fallback_keys: Set[Any] = set()
+        self.__gotos: List[Dict[str, int]] = [{}]
+        self.__fails: List[int] = [0]
+        self.__outputs: List[List[Tuple[int, Any]]] = [[]]  # By state: length of keyword and key
+        self.__built = True
+
+    # Methods -----------------------------------------------------------------
+    def add(self, key: Any, pattern: str) -> bool:
+        """
+        Add a keyword for a key.
+
+        :param key Key returned when keyword is found
+        :param pattern Keyword (simple regular expression)
+        :return If the pattern was expanded in literals (else the key is a fallback key)
+        """
+        self.keys.add(key)
+        literals = expand(pattern, self.limit)
+        if literals is None or '' in literals:
+            self.fallback_keys.add(key)
+            return False
+        for literal in literals:
+            self.__add_literal(key, fold(literal))
+        return True
+
+    def search(self, text: str) -> List[Tuple[int, int, Any]]:
+        """
+        Find all keywords in a text.
+
+        :param text Text where search
+        :return Start, end and key of each keyword found (by end)
+        """
+        if not self.__built:
+            raise Exception('Keyword automaton not built: build required after the addition of keywords')
+
+        gotos, fails, outputs = self.__gotos, self.__fails, self.__outputs
+        found = []
+        state = 0
+        for i, char in enumerate(fold(text)):
+            while state and char not in gotos[state]:
+                state = fails[state]
+            state = gotos[state].get(char, 0)
+            for length, key in outputs[state]:
+                found.append((i + 1 - length, i + 1, key))
+        return found
+
+    def build(self):
+        """Build the failure links of automaton (nothing done if already built)"""
+        if self.__built:
+            return
+
+        # Failure links by breadth-first traversal, with the outputs of failure state
+        gotos, fails, outputs = self.__gotos, self.__fails, self.__outputs
+        queue = list(gotos[0].values())
+        for state in queue:
+            fails[state] = 0
+        for state in queue:  # The queue grows in loop
+            for char, next_state in gotos[state].items():
+                queue.append(next_state)
+                fail = fails[state]
+                while fail and char not in gotos[fail]:
+                    fail = fails[fail]
+                fails[next_state] = gotos[fail].get(char, 0)
+                outputs[next_state] += [o for o in outputs[fails[next_state]] if o not in outputs[next_state]]
+        self.__built = True
+
+    def __add_literal(self, key: Any, literal: str):
+        state = 0
+        for char in literal:
+            next_state = self.__gotos[state].get(char)
+            if next_state is None:
+                next_state = len(self.__gotos)
+                self.__gotos[state][char] = next_state
+                self.__gotos.append({})
+                self.__fails.append(0)
+                self.__outputs.append([])
+            state = next_state
+        if (len(literal), key) not in self.__outputs[state]:
+            self.__outputs[state].append((len(literal), key))
+        self.__built = False
+
+
+# METHODS =====================================================================
+def fold(text: str) -> str:
+    """Fold a text for keyword search: lower case and without accents (a character by character)"""
+    return ''.join(__fold_char(c) for c in text)
+
+
+def expand(pattern: str, limit: int = 256) -> Optional[List[str]]:
+    """
+    Expand a simple regular expression in literals: literals, [abc], x?, (a|b) and (a)? are supported.
+
+    :param pattern Regular expression
+    :param limit Max count of literals
+    :return Literals matched by pattern, None if the pattern isn't supported or if there is too much literals
+    """
+    try:
+        literals, index = __expand_alternatives(pattern, 0, limit)
+    except ValueError:
+        return None
+    return literals if index == len(pattern) else None
+
+
+# METHODS - INTERNAL ==========================================================
+@lru_cache(maxsize=1024)
+def __fold_char(char: str) -> str:
+    base = unicodedata.normalize('NFKD', char)[:1] or char
+    lower = base.lower()
+    return lower if len(lower) == 1 else base  # Same length as text
+
+
+def __expand_alternatives(pattern: str, index: int, limit: int) -> Tuple[List[str], int]:
+    alternatives = []
+    while True:
+        literals, index = __expand_sequence(pattern, index, limit)
+        alternatives += literals
+        if index < len(pattern) and pattern[index] == '|':
+            index += 1
+        else:
+            return alternatives, index
+
+
+def __expand_sequence(pattern: str, index: int, limit: int) -> Tuple[List[str], int]:
+    literals = ['']
+    while index < len(pattern) and pattern[index] not in '|)':
+        char = pattern[index]
+        if char == '(':
+            atoms, index = __expand_alternatives(pattern, index + 1, limit)
+            if index >= len(pattern) or pattern[index] != ')':
+                raise ValueError('Group not closed')
+            index += 1
+        elif char == '[':
+            end = pattern.find(']', index)
+            atoms = list(pattern[index + 1:end])
+            if end < 0 or not atoms or atoms[0] == '^' or '-' in atoms or '\\' in atoms:
+                raise ValueError('Character set not supported')
+            index = end + 1
+        elif char in __specials or char == '?':
+            raise ValueError('Character not supported: ' + char)
+        else:
+            atoms = [char]
+            index += 1
+
+        if index < len(pattern) and pattern[index] == '?':
+            atoms = atoms + ['']
+            index += 1
+        literals = [literal + atom for literal in literals for atom in atoms]
+        if len(literals) > limit:
+            raise ValueError('Too much literals')
+    return literals, index
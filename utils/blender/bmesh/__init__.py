@@ -1,2 +1,4 @@
 from . import edge, face, ops, vert
 from .common import Geometry
+from .edge import EdgeRing, EdgeSet
+from .vert import ColumnIndex, VertexIndex
@@ -2,16 +2,125 @@
 Module for utility blender mesh methods
 """
 
-from typing import Callable, List, Tuple
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 from bmesh.types import BMEdge, BMesh, BMVert
 
 import utils
+from utils.collection.sequence import IndexedSequence
 from utils.math import BiLocation, Location
 from . import vert as vert_utils
 
+# TYPES =======================================================================
+EdgeKey = FrozenSet[Tuple[int, int, int]]
+
+
+# CLASSES =====================================================================
+class EdgeSet:
+    """
+    Ordered set of edges by position: the unordered pair of quantized locations of vertices (see key).<br />
+    NB: only the first edge added for a position is kept, the edges added for the same position are counted.
+    """
+
+    # Constructor -------------------------------------------------------------
+    def __init__(self, edges: Iterable[BMEdge] = ()):
+        self.__edges: Dict[EdgeKey, BMEdge] = {}  # In order of addition
+        self.__counts: Dict[EdgeKey, int] = {}
+        for edge in edges:
+            self.add(edge)
+
+    # Methods -----------------------------------------------------------------
+    def add(self, edge: BMEdge) -> bool:
+        """
+        Add an edge.
+
+        :param edge Edge to add
+        :return If the edge is new (no edge with the same position in set)
+        """
+        edge_key = key(edge)
+        count = self.__counts.get(edge_key, 0)
+        self.__counts[edge_key] = count + 1
+        if not count:
+            self.__edges[edge_key] = edge
+        return not count
+
+    def get(self, edge: BMEdge or BiLocation) -> Optional[BMEdge]:
+        """Get the edge of set with the same position"""
+        return self.__edges.get(key(edge))
+
+    def count(self, edge: BMEdge or BiLocation) -> int:
+        """Count of edges added with the same position"""
+        return self.__counts.get(key(edge), 0)
+
+    def counts(self) -> List[Tuple[BMEdge, int]]:
+        """Each edge of set with the count of edges added with the same position"""
+        return [(e, self.__counts[k]) for k, e in self.__edges.items()]
+
+    def __contains__(self, edge: BMEdge or BiLocation) -> bool:
+        return key(edge) in self.__edges
+
+    def __iter__(self) -> Iterator[BMEdge]:
+        return iter(self.__edges.values())
+
+    def __len__(self) -> int:
+        return len(self.__edges)
+
+
+class EdgeRing(IndexedSequence[BMEdge]):
+    """
+    Ordered edges of a boundary (outline, top of group...) with the positions of edges by location of their first and
+    last vertices, for find and replace a span of edges without compare all edges.<br />
+    NB: the positions are updated by each splice (see IndexedSequence): O(k + m) for k edges removed/inserted and m
+    edges after the span. The edges removed of BMesh when indexed are ignored.
+    """
+
+    # Methods -----------------------------------------------------------------
+    def starts_at(self, location: BMVert or Location) -> List[int]:
+        """Positions of edges with the first vertex at a location (in order)"""
+        return self._positions((0, vert_utils.location_key(location)))
+
+    def ends_at(self, location: BMVert or Location) -> List[int]:
+        """Positions of edges with the last vertex at a location (in order)"""
+        return self._positions((1, vert_utils.location_key(location)))
+
+    def touching(self, locations: Iterable[BMVert or Location]) -> List[int]:
+        """Positions of edges with a vertex at one of locations (in order)"""
+        positions = set()
+        for location in locations:
+            positions.update(self.starts_at(location))
+            positions.update(self.ends_at(location))
+        return sorted(positions)
+
+    def span(self, start_location: BMVert or Location, end_location: BMVert or Location) -> Tuple[int, int]:
+        """
+        Find the span of edges between two locations.
+
+        :param start_location Location of first vertex of first edge of span
+        :param end_location Location of last vertex of last edge of span
+        :return Start and end (excluded) positions of span (empty if the end is before the start)
+        """
+        starts = self.starts_at(start_location)
+        ends = self.ends_at(end_location)
+        if not starts or not ends:
+            raise ValueError('No edge found for span: <{}> -> <{}>'.format(start_location, end_location))
+        return starts[0], ends[0] + 1
+
+    def _keys(self, edge: BMEdge) -> tuple:  # overridden
+        # Identity, then locations of first vertex (0) and last vertex (1)
+        if not edge.is_valid:
+            return IndexedSequence._keys(self, edge)
+        vert1, vert2 = edge.verts
+        return IndexedSequence._keys(self, edge) + ((0, vert_utils.location_key(vert1)),
+                                                    (1, vert_utils.location_key(vert2)))
+
 
 # METHODS =====================================================================
+def key(edge: BMEdge or BiLocation) -> EdgeKey:
+    """Key of the position of an edge for hash tables (same key for same 3D position, in any direction)"""
+    vert1, vert2 = __get_vertices(edge)
+    return frozenset((vert_utils.location_key(vert1), vert_utils.location_key(vert2)))
+
+
 def new(bm: BMesh, vert1: BMVert, vert2: BMVert) -> BMEdge:
     edge = get(bm, [vert1, vert2])  # FIXME test
     if edge:  # FIXME test
@@ -81,14 +190,4 @@ def get_vertices(edges: List[BMEdge]) -> List[BMVert]:
 
 
 def get_duplicated(edges: List[BMEdge]) -> List[Tuple[BMEdge, int]]:
-    duplicated_edges = []
-    visited_edges = []
-    for edge in edges:
-        if edge not in visited_edges:
-            duplicated = [e for e in edges if same_3d_position(e, edge)]
-            visited_edges += duplicated
-
-            count = len(duplicated)
-            if count > 1:
-                duplicated_edges.append((edge, count))
-    return duplicated_edges
+    return [(e, c) for e, c in EdgeSet(edges).counts() if c > 1]
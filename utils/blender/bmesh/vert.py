@@ -2,7 +2,8 @@
 Module for utility blender mesh methods
 """
 
-from typing import Tuple
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Optional, Tuple
 
 import bpy
 from bmesh.types import BMesh, BMVert
@@ -12,13 +13,104 @@ import utils
 from utils.math import Location
 
 
+# CLASSES =====================================================================
+class VertexIndex:
+    """
+    Vertices of a BMesh by location (quantized coordinates, see utils.math.location_key), for find a vertex without
+    scan all vertices of BMesh.<br />
+    NB: the vertices must be created and removed with the index (see new and remove), a vertex removed outside the
+    index is ignored.
+    """
+
+    # Constructor -------------------------------------------------------------
+    def __init__(self, verts: Iterable[BMVert] = ()):
+        self.__verts: Dict[Tuple[int, int, int], BMVert] = {}
+        for vert in verts:
+            self.add(vert)
+
+    # Methods -----------------------------------------------------------------
+    def get(self, location: Location) -> Optional[BMVert]:
+        key = utils.math.location_key(location)
+        vert = self.__verts.get(key)
+        if vert is not None and not vert.is_valid:
+            del self.__verts[key]
+            return None
+        return vert
+
+    def add(self, vert: BMVert):
+        """Add a vertex (the first vertex added for a location is kept, like a scan of BMesh)"""
+        key = utils.math.location_key(vert.co)
+        current = self.__verts.get(key)
+        if current is None or not current.is_valid:
+            self.__verts[key] = vert
+
+    def remove(self, vert: BMVert):
+        key = utils.math.location_key(vert.co)
+        if self.__verts.get(key) is vert:
+            del self.__verts[key]
+
+    def __contains__(self, location: Location) -> bool:
+        return self.get(location) is not None
+
+    def __len__(self) -> int:
+        return len(self.__verts)
+
+
+class ColumnIndex:
+    """
+    Vertices by 2D position (column of quantized x and y, see utils.math.location_key_2d), sorted by z in each column.
+    """
+
+    # Constructor -------------------------------------------------------------
+    def __init__(self, verts: Iterable[BMVert] = ()):
+        self.__columns: Dict[Tuple[int, int], List[BMVert]] = {}
+        self.__heights: Dict[Tuple[int, int], List[float]] = {}  # z of vertices of each column
+        for vert in verts:
+            self.add(vert)
+
+    # Methods -----------------------------------------------------------------
+    def add(self, vert: BMVert):
+        key = location_key_2d(vert)
+        column = self.__columns.setdefault(key, [])
+        heights = self.__heights.setdefault(key, [])
+        index = bisect_right(heights, vert.co.z)
+        column.insert(index, vert)
+        heights.insert(index, vert.co.z)
+
+    def column(self, location: BMVert or Location) -> List[BMVert]:
+        """Vertices at the same 2D position, sorted by z"""
+        return self.__columns.get(location_key_2d(location), [])
+
+    def between(self, location: BMVert or Location, z1: float, z2: float) -> List[BMVert]:
+        """Vertices at the same 2D position with z1 < z < z2, sorted by z"""
+        key = location_key_2d(location)
+        heights = self.__heights.get(key, [])
+        return self.__columns.get(key, [])[bisect_right(heights, z1):bisect_left(heights, z2)]
+
+    def top(self, location: BMVert or Location) -> Optional[BMVert]:
+        """Highest vertex at the same 2D position"""
+        column = self.column(location)
+        return column[-1] if column else None
+
+    def bottom(self, location: BMVert or Location) -> Optional[BMVert]:
+        """Lowest vertex at the same 2D position"""
+        column = self.column(location)
+        return column[0] if column else None
+
+    def __len__(self) -> int:
+        return len(self.__columns)
+
+
 # METHODS =====================================================================
 def global_co(vert: BMVert, obj: bpy.types.Object) -> Vector:
     """Get global coordinate for a vertex"""
     return obj.matrix_world @ vert.co  # noqa
 
 
-def get(bm: BMesh, location: Location) -> BMVert:
+def get(bm: BMesh, location: Location, index: Optional[VertexIndex] = None) -> BMVert:
+    """Get the vertex at a location: from the index if given, else by a scan of all vertices of BMesh"""
+    if index is not None:
+        return index.get(location)
     vector = Vector(location) if isinstance(location, Tuple) else location
     return utils.collection.list.pnext(
         bm.verts,
@@ -26,8 +118,27 @@ def get(bm: BMesh, location: Location) -> BMVert:
     )
 
 
-def new(bm: BMesh, location: Location) -> BMVert:
-    return bm.verts.new(location)  # noqa
+def new(bm: BMesh, location: Location, index: Optional[VertexIndex] = None) -> BMVert:
+    vert = bm.verts.new(location)  # noqa
+    if index is not None:
+        index.add(vert)
+    return vert
+
+
+def remove(bm: BMesh, vert: BMVert, index: Optional[VertexIndex] = None):
+    if index is not None:
+        index.remove(vert)
+    bm.verts.remove(vert)
+
+
+def location_key(vert: BMVert or Location) -> Tuple[int, int, int]:
+    """Key of the location of a vertex for hash tables (see utils.math.location_key)"""
+    return utils.math.location_key(__get_location(vert))
+
+
+def location_key_2d(vert: BMVert or Location) -> Tuple[int, int]:
+    """Key of the 2D location of a vertex for hash tables (see utils.math.location_key_2d)"""
+    return utils.math.location_key_2d(__get_location(vert))
 
 
 def same_2d_position(vert1: BMVert or Location, vert2: BMVert or Location) -> bool:
@@ -23,10 +23,15 @@ def create(name: str, parent: bpy.types.Collection = None, erase=False) -> bpy.t
     return collection
 
 
-def remove(collection: bpy.types.Collection):
-    # FIXME remove objects in collection not working (remove template object too)
-    # objects = [object for object in collection.objects \
-    #         if object.users == 1 and object not in self.__template.objects]
-    # while objects:
-    #     bpy.data.objects.remove(objects.pop())
+def remove(collection: bpy.types.Collection, with_objects=False):
+    """Remove a collection (and optionally its children, objects and orphan meshes)"""
+    # NB: objects of collection only (the template objects aren't linked to a collection)
+    if with_objects:
+        for child in list(collection.children):
+            remove(child, True)
+        for obj in list(collection.objects):
+            data = obj.data
+            bpy.data.objects.remove(obj)
+            if isinstance(data, bpy.types.Mesh) and data.users == 0:
+                bpy.data.meshes.remove(data)
     bpy.data.collections.remove(collection)
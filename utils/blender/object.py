@@ -8,9 +8,11 @@ from mathutils import Vector
 
 
 # METHODS =====================================================================
-def create(name: str, location: Vector, template: Object, collection: Collection) \
+def create(name: str, location: Vector, template: Object, collection: Collection, copy_data=False) \
         -> bpy.types.Object:
     obj = template.copy()
+    if copy_data and template.data:
+        obj.data = template.data.copy()  # Else the data (mesh...) is shared with template
     obj.name = name
     obj.location = location
     collection.objects.link(obj)
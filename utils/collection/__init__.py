@@ -1 +1 @@
-from . import dict, list
+from . import dict, list, sequence
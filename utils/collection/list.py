@@ -45,10 +45,7 @@ def find_sublist(lst: List[T], start: DynamicIndex, end: Optional[DynamicIndex]
 
 # Insertion -------------------------------------------------------------------
 def insert_values(lst: List[T], start: int, values: List[T]):
-    i = start
-    for e in values:
-        lst.insert(i, e)
-        i += 1
+    lst[start:start] = values
 
 
 # Removing --------------------------------------------------------------------
@@ -59,8 +56,7 @@ def remove_values(lst: List[T], values: List[T]):
 
 def remove_sublist(lst: List[T], start: StaticIndex, end: Optional[StaticIndex] = None):
     start_index = __start_index(lst, start)
-    for i in range(start_index, __end_index(lst, end)):
-        lst.pop(start_index)
+    del lst[start_index:max(__end_index(lst, end), start_index)]
 
 
 def remove_duplicates(lst: List[T]) -> List[T]:
@@ -85,5 +81,8 @@ def __determine_index(lst: List[T], dyn_index: Optional[GenericIndex], dft: int)
         dyn_index, added = dyn_index
         return __determine_index(lst, dyn_index, dft) + added
     elif isinstance(dyn_index, Callable):
-        return lst.index(inext(e for e in lst if dyn_index(e)))
-    return lst.index(dyn_index)
+        index = inext(i for i, e in enumerate(lst) if dyn_index(e))
+        if index is None:
+            raise ValueError('No item found for predicate')
+        return index
+    return lst.index(dyn_index)  # NB: by identity in O(1) for an IndexedSequence
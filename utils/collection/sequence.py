@@ -0,0 +1,109 @@
+"""
+Module for indexed sequence (list with positions of items by key, identity by default)
+"""
+
+from bisect import bisect_left, insort
+from typing import Dict, Generic, Hashable, Iterator, List, Optional, Tuple, Union
+
+from utils.common import T
+
+
+# CLASSES =====================================================================
+class IndexedSequence(Generic[T]):
+    """
+    Ordered sequence of items with the positions of items by key (see _keys, identity by default) and changes by
+    slice.<br />
+    The positions are built at the first search in O(n), then each splice updates them in place: the positions of the
+    k items removed/inserted, and the positions of the m items after the span shifted (a bisect in the positions of
+    each key). So a splice is in O(k + m): cheap near the end, O(n) like a rebuild near the start.<br />
+    NB: the list of items is changed in place, it must be changed only by the sequence while it is used.
+    """
+
+    # Constructor -------------------------------------------------------------
+    def __init__(self, items: Optional[List[T]] = None):
+        self.items: List[T] = items if items is not None else []
+        self.__positions: Optional[Dict[Hashable, List[int]]] = None  # Positions by key (in order)
+        self.__keys: Optional[List[Tuple[Hashable, ...]]] = None  # Keys by position
+
+    # Methods -----------------------------------------------------------------
+    def index(self, item: T) -> int:
+        """Position of an item (first occurrence), compared by identity"""
+        positions = self._positions(id(item))
+        if not positions:
+            raise ValueError('Item not in sequence: {}'.format(item))
+        return positions[0]
+
+    def splice(self, start: int, end: int, values: List[T]) -> List[T]:
+        """
+        Replace the items from start to end (excluded) by values.
+
+        :param start Start position
+        :param end End position (excluded)
+        :param values Values to insert
+        :return Items removed
+        """
+        start, end = slice(start, end).indices(len(self.items))[:2]
+        end = max(start, end)
+        removed = self.items[start:end]
+        if self.__positions is not None:
+            self.__update_positions(start, end, values)
+        self.items[start:end] = values
+        return removed
+
+    def _keys(self, item: T) -> Tuple[Hashable, ...]:
+        """Keys of an item in positions (identity of item by default)"""
+        return id(item),
+
+    def _positions(self, key: Hashable) -> List[int]:
+        """Positions of the items with a key (in order)"""
+        if self.__positions is None:
+            self.__keys = [self._keys(item) for item in self.items]
+            self.__positions = {}
+            for i, item_keys in enumerate(self.__keys):
+                for item_key in item_keys:
+                    self.__positions.setdefault(item_key, []).append(i)
+        return list(self.__positions.get(key, ()))
+
+    def __update_positions(self, start: int, end: int, values: List[T]):
+        positions, keys = self.__positions, self.__keys
+
+        # Remove the positions of span
+        for i in range(start, end):
+            for key in keys[i]:
+                key_positions = positions[key]
+                del key_positions[bisect_left(key_positions, i)]
+                if not key_positions:
+                    del positions[key]
+
+        # Shift the positions after span (from the end if they are increased: the positions stay ordered)
+        delta = len(values) - (end - start)
+        if delta:
+            for i in (range(len(keys) - 1, end - 1, -1) if delta > 0 else range(end, len(keys))):
+                for key in keys[i]:
+                    key_positions = positions[key]
+                    key_positions[bisect_left(key_positions, i)] = i + delta
+
+        # Add the positions of values
+        values_keys = [self._keys(value) for value in values]
+        keys[start:end] = values_keys
+        for i, item_keys in enumerate(values_keys, start):
+            for key in item_keys:
+                insort(positions.setdefault(key, []), i)
+
+    def __contains__(self, item: T) -> bool:
+        return bool(self._positions(id(item)))
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        return self.items[index]
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __repr__(self):
+        return self.__class__.__name__ + '@' + repr(self.items)
+
+    def __str__(self):
+        return str(self.items)
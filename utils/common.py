@@ -11,3 +11,6 @@ K = TypeVar('K')
 V = TypeVar('V')
 
 Predicate = Callable[[T], bool]
+
+# VARIABLES ===================================================================
+blender_modules = ('bpy', 'bmesh', 'mathutils')  # Modules only available in Blender
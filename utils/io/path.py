@@ -2,7 +2,9 @@
 Module for utility path methods
 """
 
+import glob
 import os
+from typing import Dict, List, Optional
 
 
 # METHODS =====================================================================
@@ -12,3 +14,32 @@ def workspace() -> os.path:
 
 def get(path: str) -> os.path:
     return os.path.join(workspace(), path) if path.startswith('@') else os.path.realpath(path)
+
+
+def find(path: str, extensions: List[str]) -> List[os.path]:
+    """Find the files with the given extensions in a directory or matching a glob pattern"""
+    pattern = os.path.join(get(path), '*') if os.path.isdir(get(path)) else path
+    return sorted(
+        f for f in glob.glob(pattern)
+        if os.path.isfile(f) and os.path.splitext(f)[1].lower() in extensions
+    )
+
+
+def relative_targets(filepaths: List[os.path], target_dir: os.path, extension: Optional[str] = None) \
+        -> Dict[os.path, os.path]:
+    """
+    Target path of each file in a directory, relative to the common directory of files (so the files with the same
+    name in different directories have different targets).
+
+    :param filepaths Files
+    :param target_dir Target directory
+    :param extension Extension of targets (optional, extension of file by default)
+    :return Target path by file
+    """
+    paths = [os.path.realpath(f) for f in filepaths]
+    root = os.path.commonpath([os.path.dirname(p) for p in paths]) if paths else ''
+    targets = {}
+    for filepath, path in zip(filepaths, paths):
+        target = os.path.join(target_dir, os.path.relpath(path, root))
+        targets[filepath] = os.path.splitext(target)[0] + extension if extension else target
+    return targets
@@ -3,9 +3,17 @@ Module for utility math methods
 """
 
 import math
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 
-from mathutils import Vector
+try:
+    import numpy
+except ImportError:  # NumPy is optional outside Blender (batch methods unavailable)
+    numpy = None
+
+try:
+    from mathutils import Vector
+except ImportError:  # Outside Blender
+    from .vector import Vector
 
 # TYPES =======================================================================
 Location = Vector or Tuple[float, float, float] or Tuple[int, int, int]
@@ -36,6 +44,53 @@ def calc_coordinates_by_dist(p: Vector, dist: int, inverse_y: bool) -> Vector:
     return Vector((x, y, z))
 
 
+def calc_coordinates_by_dist_batch(  # Requires NumPy
+        s1_distances: Sequence[int],
+        s2_distances: Sequence[int],
+        heights: Sequence[int],
+        dist: int,
+        inverse_y: Sequence[bool]
+) -> 'numpy.ndarray':
+    """
+    Vectorized version of calc_coordinates_by_dist (same formulas, rounding and errors) for many points.
+
+    :return Array of coordinates (x, y, z) for each point
+    """
+    s1 = numpy.asarray(s1_distances, numpy.float64)
+    s2 = numpy.asarray(s2_distances, numpy.float64)
+    z = numpy.asarray(heights, numpy.float64)
+    inverse_y = numpy.asarray(inverse_y, bool)
+    if not dist:
+        raise ZeroDivisionError('float division by zero')
+
+    # Formula: round((-distS1²+distS2²-distS1S2²) / (-2 * distS1S2))
+    x = numpy.round((-numpy.square(s1) + numpy.square(s2) - math.pow(dist, 2)) / (-2 * dist)) + 0.0  # No -0.0
+
+    # Formula: distS2 == distS1S2 ? distS1 : round(sqrt(distS2²-(distS1S2-x)²))
+    same = s2 == dist
+    radicand = numpy.where(same, 0, numpy.square(s2) - numpy.square(dist - x))
+    if numpy.any(radicand < 0):
+        raise ValueError('math domain error')
+    rounded = numpy.round(numpy.sqrt(radicand))
+    y = numpy.where(same, s1, rounded)
+    y = numpy.where(inverse_y, numpy.where(same, -s1, 0.0 - rounded), y)  # -0 only for a float distS1, like scalar
+
+    # Formula:  !z ? 0 : z
+    z = numpy.where(z == 0, 0.0, z)
+
+    return numpy.stack((x, y, z), axis=1)
+
+
+def location_key(loc: Location, precision: float = 0.0001) -> Tuple[int, int, int]:
+    """Key of a location for hash tables: coordinates quantized with the precision (same key for same 3D position)"""
+    return round(__get_x(loc) / precision), round(__get_y(loc) / precision), round(__get_z(loc) / precision)
+
+
+def location_key_2d(loc: Location, precision: float = 0.0001) -> Tuple[int, int]:
+    """Key of a location for hash tables without z (same key for same 2D position)"""
+    return round(__get_x(loc) / precision), round(__get_y(loc) / precision)
+
+
 def same_2d_position(loc1: Location, loc2: Location) -> bool:
     return __get_x(loc1) == __get_x(loc2) and __get_y(loc1) == __get_y(loc2)
 
@@ -5,8 +5,20 @@ Module for utility object methods
 
 # METHODS =====================================================================
 def to_str(obj: any) -> str:
-    return str(vars(obj))
+    return str(fields(obj))
 
 
 def to_repr(obj: any) -> str:
     return obj.__class__.__name__ + '@' + to_str(obj)
+
+
+def fields(obj: any) -> dict:
+    """Fields of an object, with the fields in slots (by name as declared in class)"""
+    values = dict(vars(obj)) if hasattr(obj, '__dict__') else {}
+    for cls in reversed(type(obj).__mro__):
+        for name in getattr(cls, '__slots__', ()):
+            # Private names in slots are mangled with class name
+            attr = '_' + cls.__name__.lstrip('_') + name if name.startswith('__') else name
+            if hasattr(obj, attr):
+                values[name] = getattr(obj, attr)
+    return values
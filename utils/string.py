@@ -3,15 +3,30 @@ Module for utility string (str) methods
 """
 
 import re
+from functools import lru_cache
+from typing import Tuple
 
 
 # METHODS =====================================================================
 def match_ignore_case(pattern: str, value: str, exact: bool = True) -> re.Match:
+    m = None
+    for regex in compile_ignore_case(pattern, exact):
+        m = regex.match(value)
+        if m is not None:
+            break
+    return m
+
+
+@lru_cache(maxsize=1024)
+def compile_ignore_case(pattern: str, exact: bool = True) -> Tuple[re.Pattern, ...]:
+    """
+    Compile (once) the regular expressions used to match a pattern with match_ignore_case.
+
+    :param pattern Pattern to compile
+    :param exact If only the pattern must be compiled, else the partial variants are compiled too
+    :return Compiled variants, in the order they must be tried
+    """
     flags = re.IGNORECASE
 
-    m = re.match(pattern, value, flags)
-    if m is None and not exact:
-        m = re.match(pattern + '.*', value, flags)
-        if m is None:
-            m = re.match('.*' + pattern + '.*', value, flags)
-    return m
+    variants = [pattern] if exact else [pattern, pattern + '.*', '.*' + pattern + '.*']
+    return tuple(re.compile(v, flags) for v in variants)
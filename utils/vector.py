@@ -0,0 +1,52 @@
+"""
+Module for lightweight vector (fallback of mathutils.Vector outside Blender)
+"""
+
+from typing import Iterable, Iterator
+
+
+# CLASSES =====================================================================
+class Vector:
+    """3D vector with the subset of mathutils.Vector API used outside of drawing"""
+
+    __slots__ = ('x', 'y', 'z')
+
+    # Constructor -------------------------------------------------------------
+    def __init__(self, seq: Iterable[float] = (0, 0, 0)):
+        self.x, self.y, self.z = (float(v) for v in seq)
+
+    # Methods -----------------------------------------------------------------
+    def copy(self) -> 'Vector':
+        return Vector(self)
+
+    def to_tuple(self) -> tuple:
+        return self.x, self.y, self.z
+
+    def __copy__(self) -> 'Vector':
+        return self.copy()
+
+    def __iter__(self) -> Iterator[float]:
+        return iter((self.x, self.y, self.z))
+
+    def __len__(self) -> int:
+        return 3
+
+    def __getitem__(self, index: int) -> float:
+        return (self.x, self.y, self.z)[index]
+
+    def __setitem__(self, index: int, value: float):
+        setattr(self, ('x', 'y', 'z')[index], float(value))
+
+    def __eq__(self, other) -> bool:
+        try:
+            return tuple(self) == tuple(other)
+        except TypeError:
+            return NotImplemented
+
+    __hash__ = None  # Mutable like an unfrozen mathutils.Vector
+
+    def __repr__(self):
+        return 'Vector(({}, {}, {}))'.format(self.x, self.y, self.z)
+
+    def __str__(self):
+        return self.__repr__()